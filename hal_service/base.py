@@ -195,7 +195,8 @@ class Sensor(Device):
                 "data": data
             }
             try:
-                self.mqtt_client.publish(topic, json.dumps(message))
+                # The client encodes the dict with the configured codec
+                self.mqtt_client.publish(topic, message)
                 self.logger.log_mqtt_event(topic, "publish", "success", data_points=len(data))
             except Exception as e:
                 self.logger.log_mqtt_event(topic, "publish", "failure", error=str(e))
@@ -5,12 +5,33 @@ This module provides configuration loading and validation for hardware devices,
 supporting YAML configuration files with Pydantic schema validation.
 """
 
+import hashlib
+import json
 import os
+import re
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from pydantic import BaseModel, Field, field_validator, ValidationError
 
+try:
+    # libyaml-backed parser, much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Parsed (pre-substitution) configs keyed by (absolute path, mtime_ns, size)
+_PARSED_CACHE: Dict[tuple, Any] = {}
+
+# ${VAR_NAME} or ${VAR_NAME:default_value}
+_ENV_VAR_RE = re.compile(r'\$\{([^}:]*)(?::([^}]*))?\}')
+
+
+def clear_cache() -> None:
+    """Forget all configuration files parsed by this process."""
+    _PARSED_CACHE.clear()
+
 
 class GPIOConfig(BaseModel):
     """Configuration for GPIO-based devices."""
@@ -75,12 +96,24 @@ class SensorConfig(BaseModel):
     calibration: Optional[Dict[str, float]] = Field(None, description="Calibration parameters")
 
 
+class SafetyZoneConfig(BaseModel):
+    """Configuration for an additional LiDAR safety zone."""
+    name: str = Field("custom", description="Zone name")
+    min_angle: float = Field(0.0, description="Zone start angle in degrees")
+    max_angle: float = Field(360.0, description="Zone end angle in degrees")
+    min_distance: float = Field(0.5, ge=0.0, description="Detection distance in meters")
+    priority: int = Field(3, ge=1, description="Zone priority (1 = highest)")
+    action: str = Field("warn", pattern="^(stop|slow|warn)$", description="Action on detection")
+
+
 class SafetyConfig(BaseModel):
     """Configuration for safety systems."""
     enabled: bool = Field(True, description="Enable safety monitoring")
     obstacle_threshold: float = Field(0.5, ge=0.1, le=5.0, description="Obstacle detection threshold in meters")
     emergency_stop_timeout: float = Field(0.1, ge=0.05, le=1.0, description="Emergency stop response timeout")
-    safety_zones: List[Dict[str, float]] = Field(default_factory=list, description="Defined safety zones")
+    safety_zones: List[SafetyZoneConfig] = Field(default_factory=list, description="Defined safety zones")
+    realtime_priority: Optional[int] = Field(None, ge=1, le=99, description="SCHED_FIFO priority for safety threads (Linux, needs CAP_SYS_NICE)")
+    cpu_affinity: Optional[List[int]] = Field(None, description="CPU cores to pin safety threads to (Linux)")
 
 
 class MQTTConfig(BaseModel):
@@ -93,6 +126,9 @@ class MQTTConfig(BaseModel):
     qos_commands: int = Field(1, ge=0, le=2, description="QoS level for commands")
     qos_telemetry: int = Field(0, ge=0, le=2, description="QoS level for telemetry")
     client_id: Optional[str] = Field(None, description="MQTT client ID")
+    codec: str = Field("json", pattern="^(json|msgpack)$", description="Payload wire format, shared by all services")
+    max_inflight: int = Field(20, ge=1, le=65535, description="QoS 1/2 messages awaiting acknowledgement")
+    max_queued: int = Field(0, ge=0, description="Outgoing messages queued behind the inflight window (0 = unlimited)")
 
 
 class LoggingConfig(BaseModel):
@@ -137,6 +173,67 @@ class OrchestratorConfig(BaseModel):
         return v
 
 
+# Written by ConfigurationService.create_default_config()
+_DEFAULT_CONFIG_YAML = """\
+system:
+  logging:
+    level: INFO
+    format: json
+    max_log_size: 10485760
+    backup_count: 5
+    log_dir: logs
+    console_output: true
+    file_output: true
+  heartbeat_interval: 30.0
+mqtt:
+  broker_host: ${MQTT_HOST:localhost}
+  broker_port: 1883
+  keepalive: 60
+  qos_commands: 1
+  qos_telemetry: 0
+safety:
+  enabled: true
+  obstacle_threshold: 0.5
+  emergency_stop_timeout: 0.1
+motors:
+- name: left_motor
+  type: dc
+  gpio_pins:
+    enable: 18
+    direction: 19
+  encoder_pins:
+    a: 20
+    b: 21
+  max_speed: 1.0
+  acceleration: 0.5
+- name: right_motor
+  type: dc
+  gpio_pins:
+    enable: 22
+    direction: 23
+  encoder_pins:
+    a: 24
+    b: 25
+  max_speed: 1.0
+  acceleration: 0.5
+sensors:
+- name: lidar_01
+  type: lidar
+  interface:
+    port: /dev/ttyUSB0
+    baudrate: 115200
+    timeout: 1.0
+  publish_rate: 10.0
+- name: left_encoder
+  type: encoder
+  interface:
+    pin: 20
+    mode: IN
+    pull_up_down: PUD_UP
+  publish_rate: 20.0
+"""
+
+
 class ConfigurationService:
     """
     Service for loading and managing configuration from YAML files.
@@ -154,6 +251,8 @@ class ConfigurationService:
         """
         self.config_path = self._resolve_config_path(config_path)
         self._config: Optional[OrchestratorConfig] = None
+        self._motor_by_name: Dict[str, MotorConfig] = {}
+        self._sensor_by_name: Dict[str, SensorConfig] = {}
     
     def _resolve_config_path(self, config_path: Optional[Union[str, Path]]) -> Path:
         """
@@ -205,21 +304,119 @@ class ConfigurationService:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
         try:
-            with open(self.config_path, 'r') as f:
-                raw_config = yaml.safe_load(f)
-            
-            # Substitute environment variables
-            raw_config = self._substitute_env_vars(raw_config)
-            
-            # Validate and create config object
-            self._config = OrchestratorConfig(**raw_config)
+            return self._build_config(self._read_raw_config())
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"Failed to parse YAML config: {e}")
+    
+    def load_config_from_string(self, text: str) -> OrchestratorConfig:
+        """
+        Load configuration from YAML text instead of the configuration file.
+        
+        Args:
+            text: YAML configuration document
             
-            return self._config
+        Returns:
+            OrchestratorConfig: Validated configuration object
             
+        Raises:
+            ValidationError: If config validation fails
+            yaml.YAMLError: If YAML parsing fails
+        """
+        try:
+            return self._build_config(yaml.load(text, Loader=SafeLoader))
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Failed to parse YAML config: {e}")
-        except ValidationError as e:
-            raise e
+    
+    def _build_config(self, raw_config: Any) -> OrchestratorConfig:
+        """
+        Substitute environment variables and validate parsed configuration data.
+        
+        Args:
+            raw_config: Parsed YAML data
+            
+        Returns:
+            OrchestratorConfig: Validated configuration object
+            
+        Raises:
+            ValidationError: If config validation fails
+        """
+        # Substitute environment variables
+        raw_config = self._substitute_env_vars(raw_config)
+        
+        # Validate and create config object
+        self._config = OrchestratorConfig(**raw_config)
+        
+        # Names are unique (see OrchestratorConfig validators), index them for lookups
+        self._motor_by_name = {motor.name: motor for motor in self._config.motors}
+        self._sensor_by_name = {sensor.name: sensor for sensor in self._config.sensors}
+        
+        return self._config
+    
+    def _read_raw_config(self) -> Any:
+        """
+        Parse the configuration file, reusing a cached parse if the file is unchanged.
+        
+        Within a process, parses are kept in memory keyed by the file's path,
+        modification time and size, so a repeat load costs a single stat.
+        Environment variable substitution and validation still run on every
+        load, so changes to the environment are picked up. Across processes,
+        the parsed YAML (before environment variable substitution) is stored
+        as JSON in a ``.cache`` file next to the config, keyed by the SHA-256
+        of the source. JSON is used rather than pickle so a tampered cache
+        can't execute code. Failing to read or write the cache just falls
+        back to parsing the YAML.
+        
+        Returns:
+            Parsed configuration data
+            
+        Raises:
+            yaml.YAMLError: If YAML parsing fails
+        """
+        st = os.stat(self.config_path)
+        key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+        if key in _PARSED_CACHE:
+            return _PARSED_CACHE[key]
+        
+        raw_config = self._read_config_file()
+        _PARSED_CACHE[key] = raw_config
+        return raw_config
+    
+    def _read_config_file(self) -> Any:
+        """
+        Parse the configuration file through the on-disk JSON cache.
+        
+        Returns:
+            Parsed configuration data
+            
+        Raises:
+            yaml.YAMLError: If YAML parsing fails
+        """
+        source = self.config_path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        cache_path = self.config_path.with_name(self.config_path.name + ".cache")
+        
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get("sha256") == digest:
+                return cached["config"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        raw_config = yaml.load(source, Loader=SafeLoader)
+        
+        try:
+            # Only cache data that survives a JSON round trip unchanged
+            # (e.g. no dates or non-string keys)
+            encoded = json.dumps({"sha256": digest, "config": raw_config})
+            if json.loads(encoded)["config"] == raw_config:
+                temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                temp_path.write_text(encoded)
+                os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+        
+        return raw_config
     
     def _substitute_env_vars(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -252,17 +449,16 @@ class ConfigurationService:
         Returns:
             String with environment variables substituted
         """
-        import re
+        if '${' not in value:
+            return value
         
         def replace_env_var(match):
-            var_expr = match.group(1)
-            if ':' in var_expr:
-                var_name, default_value = var_expr.split(':', 1)
+            var_name, default_value = match.group(1, 2)
+            if default_value is not None:
                 return os.getenv(var_name, default_value)
-            else:
-                return os.getenv(var_expr, match.group(0))
+            return os.getenv(var_name, match.group(0))
         
-        return re.sub(r'\$\{([^}]+)\}', replace_env_var, value)
+        return _ENV_VAR_RE.sub(replace_env_var, value)
     
     def get_motor_config(self, motor_name: str) -> Optional[MotorConfig]:
         """
@@ -277,10 +473,7 @@ class ConfigurationService:
         if not self._config:
             self.load_config()
         
-        for motor in self._config.motors:
-            if motor.name == motor_name:
-                return motor
-        return None
+        return self._motor_by_name.get(motor_name)
     
     def get_sensor_config(self, sensor_name: str) -> Optional[SensorConfig]:
         """
@@ -295,10 +488,7 @@ class ConfigurationService:
         if not self._config:
             self.load_config()
         
-        for sensor in self._config.sensors:
-            if sensor.name == sensor_name:
-                return sensor
-        return None
+        return self._sensor_by_name.get(sensor_name)
     
     def validate_config_file(self, config_path: Optional[Union[str, Path]] = None) -> bool:
         """
@@ -338,88 +528,7 @@ class ConfigurationService:
         # Create directory if it doesn't exist
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create default configuration
-        default_config = {
-            "system": {
-                "logging": {
-                    "level": "INFO",
-                    "format": "json",
-                    "max_log_size": 10485760,
-                    "backup_count": 5,
-                    "log_dir": "logs",
-                    "console_output": True,
-                    "file_output": True
-                },
-                "heartbeat_interval": 30.0
-            },
-            "mqtt": {
-                "broker_host": "${MQTT_HOST:localhost}",
-                "broker_port": 1883,
-                "keepalive": 60,
-                "qos_commands": 1,
-                "qos_telemetry": 0
-            },
-            "safety": {
-                "enabled": True,
-                "obstacle_threshold": 0.5,
-                "emergency_stop_timeout": 0.1
-            },
-            "motors": [
-                {
-                    "name": "left_motor",
-                    "type": "dc",
-                    "gpio_pins": {
-                        "enable": 18,
-                        "direction": 19
-                    },
-                    "encoder_pins": {
-                        "a": 20,
-                        "b": 21
-                    },
-                    "max_speed": 1.0,
-                    "acceleration": 0.5
-                },
-                {
-                    "name": "right_motor", 
-                    "type": "dc",
-                    "gpio_pins": {
-                        "enable": 22,
-                        "direction": 23
-                    },
-                    "encoder_pins": {
-                        "a": 24,
-                        "b": 25
-                    },
-                    "max_speed": 1.0,
-                    "acceleration": 0.5
-                }
-            ],
-            "sensors": [
-                {
-                    "name": "lidar_01",
-                    "type": "lidar",
-                    "interface": {
-                        "port": "/dev/ttyUSB0",
-                        "baudrate": 115200,
-                        "timeout": 1.0
-                    },
-                    "publish_rate": 10.0
-                },
-                {
-                    "name": "left_encoder",
-                    "type": "encoder", 
-                    "interface": {
-                        "pin": 20,
-                        "mode": "IN",
-                        "pull_up_down": "PUD_UP"
-                    },
-                    "publish_rate": 20.0
-                }
-            ]
-        }
-        
-        with open(config_path, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False, indent=2)
+        config_path.write_text(_DEFAULT_CONFIG_YAML)
         
         return config_path
 
@@ -9,6 +9,7 @@ Requirements covered: 1.1, 1.2, 1.3, 2.2
 
 import time
 import threading
+from collections import deque
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -47,6 +48,13 @@ from .base import Sensor
 from .config import SensorConfig
 
 
+# Tick delta for a quadrature transition, indexed by
+# (last_a << 3) | (last_b << 2) | (a << 1) | b. A single-channel change
+# counts +1 when A leads B and -1 when B leads A; no change, or both
+# channels changing at once (a missed edge), counts 0.
+_QUAD_LUT = (0, -1, 1, 0, 1, 0, 0, -1, -1, 0, 0, 1, 0, 1, -1, 0)
+
+
 class EncoderSensor(Sensor):
     """
     Wheel Encoder Sensor for precise distance and velocity measurement.
@@ -91,10 +99,11 @@ class EncoderSensor(Sensor):
                 self.encoder_pin_b = int(self.encoder_pin_b)
             self.pull_up_down = 'PUD_UP'
         
-        # Encoder parameters from calibration
-        self.encoder_resolution = int(calibration.get('resolution', 1000))  # Pulses per revolution
-        self.wheel_diameter = float(calibration.get('wheel_diameter', 0.1))  # meters
-        self.gear_ratio = float(calibration.get('gear_ratio', 1.0))  # Motor to wheel gear ratio
+        # Encoder parameters from calibration (see the properties below)
+        self._encoder_resolution = int(calibration.get('resolution', 1000))  # Pulses per revolution
+        self._wheel_diameter = float(calibration.get('wheel_diameter', 0.1))  # meters
+        self._gear_ratio = float(calibration.get('gear_ratio', 1.0))  # Motor to wheel gear ratio
+        self._update_calibration()
         
         # Encoder state
         self.tick_count = 0
@@ -106,7 +115,7 @@ class EncoderSensor(Sensor):
         self.last_tick_time = time.time()
         self.last_velocity_update = time.time()
         self.velocity_window = 0.1  # seconds for velocity averaging
-        self.recent_ticks = []  # List of (timestamp, tick_count) tuples
+        self.recent_ticks = deque()  # (timestamp, tick_count) tuples, oldest first
         
         # Thread safety
         self._encoder_lock = threading.Lock()
@@ -121,6 +130,42 @@ class EncoderSensor(Sensor):
         
         self.logger.info(f"EncoderSensor {device_id} initialized with config: {config}")
     
+    @property
+    def encoder_resolution(self) -> int:
+        """Encoder pulses per revolution."""
+        return self._encoder_resolution
+    
+    @encoder_resolution.setter
+    def encoder_resolution(self, value: int):
+        self._encoder_resolution = value
+        self._update_calibration()
+    
+    @property
+    def wheel_diameter(self) -> float:
+        """Wheel diameter in meters."""
+        return self._wheel_diameter
+    
+    @wheel_diameter.setter
+    def wheel_diameter(self, value: float):
+        self._wheel_diameter = value
+        self._update_calibration()
+    
+    @property
+    def gear_ratio(self) -> float:
+        """Motor to wheel gear ratio."""
+        return self._gear_ratio
+    
+    @gear_ratio.setter
+    def gear_ratio(self, value: float):
+        self._gear_ratio = value
+        self._update_calibration()
+    
+    def _update_calibration(self):
+        """Recompute the per-tick distance and RPM factors after a calibration change."""
+        wheel_circumference = 3.14159 * self._wheel_diameter
+        self._distance_per_tick = (wheel_circumference / self._encoder_resolution) / self._gear_ratio
+        self._rpm_per_velocity = 60.0 / wheel_circumference  # m/s -> wheel RPM
+    
     def initialize(self) -> bool:
         """
         Initialize GPIO pins and interrupt handlers.
@@ -200,14 +245,11 @@ class EncoderSensor(Sensor):
                 
                 # Determine direction and count
                 if self.encoder_pin_b:
-                    # Quadrature encoding - determine direction
-                    if a_state != self.last_a_state:
-                        if a_state != b_state:
-                            self.direction = 1  # Forward
-                            self.tick_count += 1
-                        else:
-                            self.direction = -1  # Reverse
-                            self.tick_count -= 1
+                    # Quadrature encoding - look up the transition
+                    delta = _QUAD_LUT[(self.last_a_state << 3) | (self.last_b_state << 2) | (a_state << 1) | b_state]
+                    if delta:
+                        self.direction = delta
+                        self.tick_count += delta
                 else:
                     # Single channel - assume forward direction
                     if a_state != self.last_a_state:
@@ -242,14 +284,11 @@ class EncoderSensor(Sensor):
                 a_state = GPIO.input(self.encoder_pin_a)
                 b_state = GPIO.input(self.encoder_pin_b)
                 
-                # Quadrature encoding - determine direction
-                if b_state != self.last_b_state:
-                    if a_state == b_state:
-                        self.direction = 1  # Forward
-                        self.tick_count += 1
-                    else:
-                        self.direction = -1  # Reverse
-                        self.tick_count -= 1
+                # Quadrature encoding - look up the transition
+                delta = _QUAD_LUT[(self.last_a_state << 3) | (self.last_b_state << 2) | (a_state << 1) | b_state]
+                if delta:
+                    self.direction = delta
+                    self.tick_count += delta
                 
                 # Update states
                 self.last_a_state = a_state
@@ -275,9 +314,12 @@ class EncoderSensor(Sensor):
         # Add current tick to recent history
         self.recent_ticks.append((current_time, self.tick_count))
         
-        # Remove old ticks outside velocity window
+        # Remove old ticks outside velocity window; ticks arrive in time
+        # order, so only the front of the queue can have expired
         cutoff_time = current_time - self.velocity_window
-        self.recent_ticks = [(t, count) for t, count in self.recent_ticks if t >= cutoff_time]
+        recent_ticks = self.recent_ticks
+        while recent_ticks[0][0] < cutoff_time:
+            recent_ticks.popleft()
         
         # Calculate velocity if we have enough data
         if len(self.recent_ticks) >= 2:
@@ -286,18 +328,12 @@ class EncoderSensor(Sensor):
             tick_diff = self.tick_count - oldest_count
             
             if time_diff > 0:
-                # Calculate distance per tick
-                wheel_circumference = 3.14159 * self.wheel_diameter
-                distance_per_tick = (wheel_circumference / self.encoder_resolution) / self.gear_ratio
-                
                 # Calculate velocity (m/s)
-                distance_traveled = tick_diff * distance_per_tick
+                distance_traveled = tick_diff * self._distance_per_tick
                 self.velocity = distance_traveled / time_diff
         
         # Update total distance
-        wheel_circumference = 3.14159 * self.wheel_diameter
-        distance_per_tick = (wheel_circumference / self.encoder_resolution) / self.gear_ratio
-        self.total_distance = self.tick_count * distance_per_tick
+        self.total_distance = self.tick_count * self._distance_per_tick
     
     def read_data(self) -> Dict[str, Any]:
         """
@@ -310,15 +346,10 @@ class EncoderSensor(Sensor):
             current_time = time.time()
             
             with self._encoder_lock:
-                # Calculate derived values
-                wheel_circumference = 3.14159 * self.wheel_diameter
-                distance_per_tick = (wheel_circumference / self.encoder_resolution) / self.gear_ratio
-                
                 # Calculate RPM if we have recent velocity data
                 rpm = 0.0
-                if abs(self.velocity) > 0.001:  # Avoid division by very small numbers
-                    wheel_rps = abs(self.velocity) / wheel_circumference  # Revolutions per second
-                    rpm = wheel_rps * 60.0  # Convert to RPM
+                if abs(self.velocity) > 0.001:  # Ignore noise around standstill
+                    rpm = abs(self.velocity) * self._rpm_per_velocity
                 
                 data = {
                     "tick_count": self.tick_count,
@@ -326,10 +357,10 @@ class EncoderSensor(Sensor):
                     "velocity": self.velocity,
                     "direction": self.direction,
                     "rpm": rpm,
-                    "distance_per_tick": distance_per_tick,
-                    "wheel_diameter": self.wheel_diameter,
-                    "encoder_resolution": self.encoder_resolution,
-                    "gear_ratio": self.gear_ratio,
+                    "distance_per_tick": self._distance_per_tick,
+                    "wheel_diameter": self._wheel_diameter,
+                    "encoder_resolution": self._encoder_resolution,
+                    "gear_ratio": self._gear_ratio,
                     "interrupt_count": self.interrupt_count,
                     "last_interrupt_time": self.last_interrupt_time,
                     "pins": {
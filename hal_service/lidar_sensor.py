@@ -163,6 +163,10 @@ class LidarSensor(Sensor):
         self.scanning = False
         self.scan_thread = None
         
+        # Pack ranges/angles as float32 when the client's codec can carry
+        # binary; ask the client, since the mock client always sends JSON
+        self._binary_scans = getattr(mqtt_client, 'codec', 'json') == 'msgpack'
+        
         # Scan data
         self.current_scan = None
         self.scan_count = 0
@@ -178,6 +182,23 @@ class LidarSensor(Sensor):
         
         self.logger.info(f"LidarSensor {device_id} initialized with config: {config}")
     
+    def publish_data(self, data: Dict[str, Any]) -> None:
+        """
+        Publish scan data to MQTT.
+        
+        With the msgpack codec, ranges and angles are sent as little-endian
+        float32 buffers instead of number lists.
+        
+        Args:
+            data: Scan data dictionary from read_data
+        """
+        if self._binary_scans and data.get("scan_available"):
+            data = dict(data)
+            for field in ("ranges", "angles"):
+                values = data[field]
+                data[field] = struct.pack(f"<{len(values)}f", *values)
+        super().publish_data(data)
+    
     def initialize(self) -> bool:
         """
         Initialize serial connection and start LiDAR communication.
@@ -474,6 +495,7 @@ class LidarSensor(Sensor):
                 data = {
                     "scan_available": True,
                     "timestamp": scan.timestamp.isoformat(),
+                    "timestamp_ns": int(scan.timestamp.timestamp() * 1e9),
                     "ranges": scan.ranges,
                     "angles": scan.angles,
                     "quality": scan.quality,
@@ -121,15 +121,19 @@ class StructuredLogger:
         self._context: Dict[str, Any] = {}
         self._lock = threading.Lock()
     
-    def _log_with_context(self, level: int, message: str, **kwargs) -> None:
+    def _log_with_context(self, level: int, message: str, *args, **kwargs) -> None:
         """
         Log a message with current context information.
         
         Args:
             level: Log level (logging.DEBUG, INFO, etc.)
-            message: Log message
+            message: Log message, optionally with %-style placeholders
+            *args: Arguments merged into the message when it is emitted
             **kwargs: Additional context fields
         """
+        if not self.logger.isEnabledFor(level):
+            return
+        
         with self._lock:
             # Merge context with kwargs
             extra_fields = {**self._context, **kwargs}
@@ -141,29 +145,33 @@ class StructuredLogger:
                 "platform": "orchestrator"
             })
             
-            self.logger.log(level, message, extra=extra_fields)
+            self.logger.log(level, message, *args, extra=extra_fields)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
     
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """Log a debug message."""
-        self._log_with_context(logging.DEBUG, message, **kwargs)
+        self._log_with_context(logging.DEBUG, message, *args, **kwargs)
     
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """Log an info message."""
-        self._log_with_context(logging.INFO, message, **kwargs)
+        self._log_with_context(logging.INFO, message, *args, **kwargs)
     
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """Log a warning message."""
-        self._log_with_context(logging.WARNING, message, **kwargs)
+        self._log_with_context(logging.WARNING, message, *args, **kwargs)
     
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """Log an error message."""
-        self._log_with_context(logging.ERROR, message, **kwargs)
+        self._log_with_context(logging.ERROR, message, *args, **kwargs)
     
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """Log a critical message."""
-        self._log_with_context(logging.CRITICAL, message, **kwargs)
+        self._log_with_context(logging.CRITICAL, message, *args, **kwargs)
     
-    def exception(self, message: str, **kwargs) -> None:
+    def exception(self, message: str, *args, **kwargs) -> None:
         """Log an exception with traceback."""
         with self._lock:
             # Merge context with kwargs
@@ -177,7 +185,7 @@ class StructuredLogger:
             })
             
             # Use exc_info=True directly in the log call, not in extra
-            self.logger.log(logging.ERROR, message, extra=extra_fields, exc_info=True)
+            self.logger.log(logging.ERROR, message, *args, extra=extra_fields, exc_info=True)
     
     def set_context(self, **kwargs) -> None:
         """
@@ -8,7 +8,7 @@ requiring an actual MQTT broker. Useful for testing and development.
 import json
 import time
 import threading
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 from collections import defaultdict
@@ -16,6 +16,28 @@ from collections import defaultdict
 # Import MQTTConfig from parent config module
 from ..config import MQTTConfig
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder
+    orjson = None
+
+
+# Same JSON encoding as MQTTClientWrapper's 'json' codec, without pulling in paho-mqtt
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def _dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS)
+    
+    _loads = orjson.loads
+else:
+    def _dumps(payload: Any) -> bytes:
+        return json.dumps(payload, default=str).encode('utf-8')
+    
+    def _loads(data: bytes) -> Any:
+        return json.loads(data.decode('utf-8'))
+
 
 @dataclass
 class MockMessage:
@@ -27,6 +49,15 @@ class MockMessage:
     timestamp: float = field(default_factory=time.time)
 
 
+class _TopicNode:
+    """One level of the subscription trie; '+' and '#' are ordinary child keys."""
+    __slots__ = ('children', 'callbacks')
+    
+    def __init__(self):
+        self.children: Dict[str, '_TopicNode'] = {}
+        self.callbacks: Dict[str, Callable] = {}  # filters ending at this level
+
+
 class MockMQTTClient:
     """
     Mock MQTT client that simulates broker behavior for testing.
@@ -45,6 +76,7 @@ class MockMQTTClient:
         # Message storage and routing
         self.message_history: List[MockMessage] = []
         self.subscribers: Dict[str, Callable] = {}
+        self._subscription_trie = _TopicNode()  # same filters as subscribers, by level
         self.retained_messages: Dict[str, MockMessage] = {}
         
         # Simulation parameters
@@ -101,7 +133,7 @@ class MockMQTTClient:
         
         # Convert payload to bytes if needed
         if isinstance(payload, dict):
-            payload_bytes = json.dumps(payload).encode('utf-8')
+            payload_bytes = _dumps(payload)
         elif isinstance(payload, str):
             payload_bytes = payload.encode('utf-8')
         else:
@@ -150,6 +182,7 @@ class MockMQTTClient:
         """Add callback for specific topic"""
         with self._lock:
             self.subscribers[topic] = callback
+            self._trie_add(topic, callback)
         
         # Deliver any retained messages for this topic
         self._deliver_retained_for_topic(topic, callback)
@@ -158,6 +191,7 @@ class MockMQTTClient:
         """Remove callback for specific topic"""
         with self._lock:
             self.subscribers.pop(topic, None)
+            self._trie_remove(topic)
     
     def unsubscribe(self, topic: str) -> bool:
         """Simulate unsubscribing from a topic"""
@@ -166,28 +200,83 @@ class MockMQTTClient:
         
         with self._lock:
             self.subscribers.pop(topic, None)
+            self._trie_remove(topic)
             self.stats['subscription_count'] = max(0, self.stats['subscription_count'] - 1)
         
         return True
     
+    def _trie_add(self, pattern: str, callback: Callable):
+        """Add a topic filter to the subscription trie"""
+        node = self._subscription_trie
+        for level in pattern.split('/'):
+            node = node.children.setdefault(level, _TopicNode())
+        node.callbacks[pattern] = callback
+    
+    def _trie_remove(self, pattern: str):
+        """Remove a topic filter from the subscription trie, pruning empty levels"""
+        node = self._subscription_trie
+        path = []
+        for level in pattern.split('/'):
+            child = node.children.get(level)
+            if child is None:
+                return
+            path.append((node, level))
+            node = child
+        
+        node.callbacks.pop(pattern, None)
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.callbacks or child.children:
+                break
+            del parent.children[level]
+    
+    def _match_subscribers(self, topic: str) -> List[Tuple[str, Callable]]:
+        """Find subscriptions matching a topic by walking the trie level by level"""
+        matches = []
+        nodes = [self._subscription_trie]
+        for level in topic.split('/'):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                # '#' matches this level and everything below it
+                multi = children.get('#')
+                if multi is not None:
+                    matches.extend(multi.callbacks.items())
+                child = children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+                child = children.get('+')
+                if child is not None:
+                    next_nodes.append(child)
+            nodes = next_nodes
+            if not nodes:
+                return matches
+        
+        for node in nodes:
+            matches.extend(node.callbacks.items())
+            # 'a/#' also matches the parent topic 'a'
+            multi = node.children.get('#')
+            if multi is not None:
+                matches.extend(multi.callbacks.items())
+        return matches
+    
     def _deliver_message(self, message: MockMessage):
         """Deliver message to matching subscribers"""
-        for topic_pattern, callback in self.subscribers.items():
-            if self._topic_matches(message.topic, topic_pattern):
-                try:
-                    # Create mock message object similar to paho-mqtt
-                    mock_msg = type('MockMsg', (), {
-                        'topic': message.topic,
-                        'payload': message.payload,
-                        'qos': message.qos,
-                        'retain': message.retain
-                    })()
-                    
-                    callback(self, None, mock_msg)
-                    self.stats['messages_received'] += 1
-                    
-                except Exception as e:
-                    print(f"Error in message callback for {topic_pattern}: {e}")
+        for topic_pattern, callback in self._match_subscribers(message.topic):
+            try:
+                # Create mock message object similar to paho-mqtt
+                mock_msg = type('MockMsg', (), {
+                    'topic': message.topic,
+                    'payload': message.payload,
+                    'qos': message.qos,
+                    'retain': message.retain
+                })()
+                
+                callback(self, None, mock_msg)
+                self.stats['messages_received'] += 1
+                
+            except Exception as e:
+                print(f"Error in message callback for {topic_pattern}: {e}")
     
     def _deliver_retained_messages(self):
         """Deliver retained messages to all subscribers"""
@@ -212,31 +301,24 @@ class MockMQTTClient:
                     print(f"Error delivering retained message: {e}")
     
     def _topic_matches(self, topic: str, pattern: str) -> bool:
-        """Check if topic matches subscription pattern with wildcards"""
+        """Check if topic matches subscription pattern with wildcards (same rules as the trie)"""
         # Handle exact match
         if topic == pattern:
             return True
         
-        # Handle single-level wildcard (+)
-        if '+' in pattern:
-            topic_parts = topic.split('/')
-            pattern_parts = pattern.split('/')
-            
-            if len(topic_parts) != len(pattern_parts):
+        topic_parts = topic.split('/')
+        pattern_parts = pattern.split('/')
+        for i, p_part in enumerate(pattern_parts):
+            # '#' matches this level and everything below it, including the parent ('a/#' matches 'a')
+            if p_part == '#':
+                return True
+            if i >= len(topic_parts):
+                return False
+            # '+' matches exactly one level
+            if p_part != '+' and p_part != topic_parts[i]:
                 return False
-            
-            for t_part, p_part in zip(topic_parts, pattern_parts):
-                if p_part != '+' and p_part != t_part:
-                    return False
-            
-            return True
-        
-        # Handle multi-level wildcard (#)
-        if pattern.endswith('#'):
-            prefix = pattern[:-1]  # Remove the '#'
-            return topic.startswith(prefix)
         
-        return False
+        return len(topic_parts) == len(pattern_parts)
     
     def _should_fail(self) -> bool:
         """Determine if operation should fail based on failure rate"""
@@ -287,6 +369,7 @@ class MockMQTTClient:
             self.connected = False
             self.message_history.clear()
             self.subscribers.clear()
+            self._subscription_trie = _TopicNode()
             self.retained_messages.clear()
             self.stats = {
                 'messages_published': 0,
@@ -302,6 +385,9 @@ class MockMQTTClientWrapper:
     Mock wrapper that mimics the MQTTClientWrapper interface
     """
     
+    # Payloads always go through _dumps/_loads (JSON), whatever config.codec says
+    codec = 'json'
+    
     def __init__(self, config):
         self.config = config
         self._client = MockMQTTClient(config.client_id)
@@ -375,7 +461,7 @@ class MockMQTTClientWrapper:
         def wrapper(client, userdata, message):
             try:
                 # Parse JSON payload
-                payload = json.loads(message.payload.decode('utf-8'))
+                payload = _loads(message.payload)
                 
                 # Create message data structure
                 message_data = {
@@ -11,12 +11,18 @@ import json
 import logging
 import time
 import threading
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Literal, Union
 from dataclasses import dataclass
 from datetime import datetime
 import paho.mqtt.client as mqtt
 import re
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder
+    orjson = None
+
 
 @dataclass
 class MQTTConfig:
@@ -29,6 +35,29 @@ class MQTTConfig:
     password: Optional[str] = None
     max_reconnect_delay: int = 300  # 5 minutes
     base_reconnect_delay: int = 1   # 1 second
+    codec: Literal['json', 'msgpack'] = 'json'  # wire format, must match on both ends
+    max_inflight: int = 20  # QoS 1/2 messages awaiting acknowledgement
+    max_queued: int = 0     # outgoing messages queued behind the inflight window (0 = unlimited)
+    
+    @classmethod
+    def from_config(cls, mqtt_section: Any, client_id: str) -> 'MQTTConfig':
+        """Build client settings from the ``mqtt`` section of the orchestrator config.
+        
+        Args:
+            mqtt_section: ``OrchestratorConfig.mqtt`` (``hal_service.config.MQTTConfig``)
+            client_id: Client ID for this connection; every service needs its own
+        """
+        return cls(
+            broker_host=mqtt_section.broker_host,
+            broker_port=mqtt_section.broker_port,
+            keepalive=mqtt_section.keepalive,
+            client_id=client_id,
+            username=mqtt_section.username,
+            password=mqtt_section.password,
+            codec=mqtt_section.codec,
+            max_inflight=mqtt_section.max_inflight,
+            max_queued=mqtt_section.max_queued
+        )
 
 
 class TopicValidator:
@@ -38,7 +67,8 @@ class TopicValidator:
     VALID_PATTERNS = {
         'command': r'^orchestrator/cmd/[a-zA-Z0-9_]+$',
         'data': r'^orchestrator/data/[a-zA-Z0-9_]+$',
-        'status': r'^orchestrator/status/[a-zA-Z0-9_]+$'
+        'status': r'^orchestrator/status/[a-zA-Z0-9_]+$',
+        'ack': r'^orchestrator/ack/[a-zA-Z0-9_]+$'
     }
     
     @classmethod
@@ -51,7 +81,7 @@ class TopicValidator:
     
     @classmethod
     def get_topic_type(cls, topic: str) -> Optional[str]:
-        """Get the type of topic (command, data, status)"""
+        """Get the type of topic (command, data, status, ack)"""
         for topic_type, pattern in cls.VALID_PATTERNS.items():
             if re.match(pattern, topic):
                 return topic_type
@@ -64,7 +94,7 @@ class MQTTClientWrapper:
     
     Features:
     - Automatic reconnection with exponential backoff
-    - JSON serialization/deserialization
+    - JSON (default) or msgpack serialization/deserialization
     - Topic validation
     - Message callbacks with error handling
     - Connection status monitoring
@@ -84,16 +114,68 @@ class MQTTClientWrapper:
         self._message_callbacks: Dict[str, Callable] = {}
         self._connection_callbacks: Dict[str, Callable] = {}
         
+        # Payload codec (bound once so publish/receive skip the lookup)
+        self._dumps, self._loads = self._select_codec(config.codec)
+        self.codec = config.codec
+        
         # Initialize MQTT client (using callback API version 2)
         self._client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=config.client_id)
         self._setup_client()
     
+    @staticmethod
+    def _select_codec(codec: str):
+        """
+        Select payload serializer/deserializer functions for the configured codec.
+        
+        Args:
+            codec: Codec name ('json' or 'msgpack')
+            
+        Returns:
+            Tuple of (dumps, loads) callables operating on bytes
+        """
+        if codec == 'json':
+            if orjson is not None:
+                options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                
+                def dumps(payload):
+                    return orjson.dumps(payload, default=str, option=options)
+                
+                return dumps, orjson.loads
+            
+            def dumps(payload):
+                return json.dumps(payload, default=str).encode('utf-8')
+            
+            def loads(data):
+                return json.loads(data.decode('utf-8'))
+            
+            return dumps, loads
+        
+        if codec == 'msgpack':
+            try:
+                import msgpack
+            except ImportError:
+                raise ImportError("msgpack codec requested but the 'msgpack' package is not installed")
+            
+            def dumps(payload):
+                return msgpack.packb(payload, use_bin_type=True, default=str)
+            
+            def loads(data):
+                return msgpack.unpackb(data, raw=False)
+            
+            return dumps, loads
+        
+        raise ValueError(f"Unsupported MQTT codec: {codec}")
+    
     def _setup_client(self):
         """Setup MQTT client with callbacks"""
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
         self._client.on_message = self._on_message
         
+        # Acknowledgement window for QoS > 0 publishes
+        self._client.max_inflight_messages_set(self.config.max_inflight)
+        self._client.max_queued_messages_set(self.config.max_queued)
+        
         # Set credentials if provided
         if self.config.username and self.config.password:
             self._client.username_pw_set(
@@ -143,11 +225,11 @@ class MQTTClientWrapper:
                 self.logger.warning(f"Received message on invalid topic: {topic}")
                 return
             
-            # Deserialize JSON payload
+            # Deserialize payload with the configured codec
             try:
-                payload = json.loads(msg.payload.decode('utf-8'))
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to decode JSON message on topic {topic}: {e}")
+                payload = self._loads(msg.payload)
+            except ValueError as e:
+                self.logger.error(f"Failed to decode {self.config.codec} message on topic {topic}: {e}")
                 return
             
             # Add metadata
@@ -234,13 +316,16 @@ class MQTTClientWrapper:
         self._client.disconnect()
         self._connected = False
     
-    def publish(self, topic: str, payload: Dict[str, Any], qos: int = 0, retain: bool = False) -> bool:
+    def publish(self, topic: str, payload: Union[Dict[str, Any], str, bytes], qos: int = 0,
+                retain: bool = False) -> bool:
         """
         Publish a message to MQTT broker
         
         Args:
             topic: MQTT topic to publish to
-            payload: Dictionary payload to serialize as JSON
+            payload: Dictionary payload to serialize with the configured codec,
+                a JSON string (re-encoded if the codec is not JSON), or bytes
+                already encoded by the caller (sent as-is)
             qos: Quality of Service level (0, 1, or 2)
             retain: Whether to retain the message
             
@@ -257,15 +342,26 @@ class MQTTClientWrapper:
             return False
         
         try:
-            # Add timestamp if not present
-            if 'timestamp' not in payload:
-                payload['timestamp'] = datetime.now().isoformat()
-            
-            # Serialize to JSON
-            json_payload = json.dumps(payload, default=str)
+            if isinstance(payload, (bytes, bytearray)):
+                # Pre-encoded by the caller
+                encoded_payload = payload
+            elif isinstance(payload, str):
+                # JSON text serialized by the caller; send it as-is rather than
+                # encoding it a second time as a JSON string
+                if self.config.codec == 'json':
+                    encoded_payload = payload.encode('utf-8')
+                else:
+                    encoded_payload = self._dumps(json.loads(payload))
+            else:
+                # Add timestamp if not present
+                if 'timestamp' not in payload:
+                    payload['timestamp'] = datetime.now().isoformat()
+                
+                # Serialize with the configured codec (JSON by default)
+                encoded_payload = self._dumps(payload)
             
             # Publish message
-            result = self._client.publish(topic, json_payload, qos=qos, retain=retain)
+            result = self._client.publish(topic, encoded_payload, qos=qos, retain=retain)
             
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
                 self.logger.debug(f"Published message to {topic}")
@@ -350,6 +446,7 @@ class MQTTClientWrapper:
             'broker_host': self.config.broker_host,
             'broker_port': self.config.broker_port,
             'client_id': self.config.client_id,
+            'codec': self.config.codec,
             'subscriptions': list(self._message_callbacks.keys()),
             'reconnect_delay': self._reconnect_delay
         }
\ No newline at end of file
@@ -9,20 +9,119 @@ Requirements covered: 5.1, 5.2, 5.3, 5.4
 """
 
 import json
+import logging
+import os
 import time
 import signal
 import sys
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 from .mqtt_client import MQTTClientWrapper, MQTTConfig
 from .config import load_config, SafetyConfig
 from .logging_service import get_logging_service
 
 
+def _parse_lidar_timestamp(lidar_data: Dict[str, Any]) -> datetime:
+    """
+    Parse a LiDAR scan timestamp into a naive local datetime.
+    
+    Prefers the numeric ``timestamp_ns`` epoch when the producer sends it,
+    otherwise parses the ISO-8601 ``timestamp`` string.
+    
+    Args:
+        lidar_data: LiDAR scan data dictionary
+        
+    Returns:
+        Scan time comparable with datetime.now()
+    """
+    timestamp_ns = lidar_data.get('timestamp_ns')
+    if timestamp_ns is not None:
+        return datetime.fromtimestamp(timestamp_ns / 1e9)
+    
+    timestamp = lidar_data['timestamp']
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(timestamp)
+    
+    # Offset-aware stamps are converted to local time so timeouts can be computed
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _as_scan_array(values: Any) -> np.ndarray:
+    """
+    Convert a LiDAR ranges/angles field to a NumPy array.
+    
+    Binary fields (e.g. msgpack ``bin``) are little-endian float32 and are
+    wrapped without copying; lists are converted to float64.
+    
+    Args:
+        values: List of numbers or a packed float32 buffer
+        
+    Returns:
+        One-dimensional array of values
+    """
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return np.frombuffer(values, dtype='<f4')
+    return np.asarray(values, dtype=np.float64)
+
+
+def _zone_angle_masks(normalized_angles: np.ndarray, zone_min_angle: np.ndarray,
+                      zone_max_angle: np.ndarray) -> np.ndarray:
+    """
+    Compute which beams fall inside each zone's angular range.
+    
+    Args:
+        normalized_angles: Beam angles mapped to 0-360 degrees, shape (N,)
+        zone_min_angle: Per-zone minimum angle, shape (Z,)
+        zone_max_angle: Per-zone maximum angle, shape (Z,)
+        
+    Returns:
+        Boolean matrix of shape (Z, N)
+    """
+    angles = normalized_angles[np.newaxis, :]
+    zmin = zone_min_angle[:, np.newaxis]
+    zmax = zone_max_angle[:, np.newaxis]
+    
+    # Zones with min > max cross 0° and use the complementary test
+    return np.where(
+        zmin <= zmax,
+        (angles >= zmin) & (angles <= zmax),
+        (angles >= zmin) | (angles <= zmax)
+    )
+
+
+def _scan_all_zones(ranges: np.ndarray, zone_masks: np.ndarray,
+                    zone_min_distance: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate every safety zone against a scan in a single broadcast pass.
+    
+    Args:
+        ranges: Distance measurements, shape (N,)
+        zone_masks: Beam membership per zone from _zone_angle_masks, shape (Z, N)
+        zone_min_distance: Per-zone distance threshold, shape (Z,)
+        
+    Returns:
+        Tuple of (zone_indices, point_indices) for every hit, ordered by zone
+    """
+    hits = zone_masks & (ranges >= 0.1) & (ranges <= zone_min_distance[:, np.newaxis])
+    
+    return np.nonzero(hits)
+
+
 @dataclass
 class SafetyZone:
     """Definition of a safety zone for obstacle detection."""
@@ -44,6 +143,99 @@ class ObstacleDetection:
     severity: str  # "critical", "warning", "info"
 
 
+class DetectionHistory:
+    """
+    Fixed-capacity ring buffer of obstacle detections stored as parallel arrays.
+    
+    Each row holds the detection time (epoch seconds), distance, angle, zone
+    index and whether the zone is critical. Writing a scan's detections is a
+    handful of array assignments with no per-detection Python objects.
+    """
+    
+    def __init__(self, capacity: int = 500):
+        """
+        Initialize the detection history.
+        
+        Args:
+            capacity: Maximum number of detections retained
+        """
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.distances = np.zeros(capacity, dtype=np.float64)
+        self.angles = np.zeros(capacity, dtype=np.float64)
+        self.zones = np.zeros(capacity, dtype=np.int16)
+        self.critical = np.zeros(capacity, dtype=bool)
+        self._head = 0  # Next row to write
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append_batch(self, timestamp: float, distances: np.ndarray, angles: np.ndarray,
+                     zones: np.ndarray, critical: np.ndarray) -> None:
+        """
+        Append the detections from one scan.
+        
+        Args:
+            timestamp: Scan time in epoch seconds, shared by all rows
+            distances: Detection distances
+            angles: Detection angles
+            zones: Zone index of each detection
+            critical: Whether each detection is in a critical zone
+        """
+        count = len(distances)
+        if count == 0:
+            return
+        
+        # Only the newest rows survive when a scan exceeds the capacity
+        if count > self.capacity:
+            distances, angles = distances[-self.capacity:], angles[-self.capacity:]
+            zones, critical = zones[-self.capacity:], critical[-self.capacity:]
+            count = self.capacity
+        
+        rows = (self._head + np.arange(count)) % self.capacity
+        self.timestamps[rows] = timestamp
+        self.distances[rows] = distances
+        self.angles[rows] = angles
+        self.zones[rows] = zones
+        self.critical[rows] = critical
+        
+        self._head = (self._head + count) % self.capacity
+        self._count = min(self._count + count, self.capacity)
+    
+    def recent_rows(self, count: int) -> np.ndarray:
+        """
+        Get row indices of the most recent detections, oldest first.
+        
+        Args:
+            count: Maximum number of rows to return
+            
+        Returns:
+            Array of row indices into the history arrays
+        """
+        count = min(count, self._count)
+        return (self._head - count + np.arange(count)) % self.capacity
+    
+    def has_recent_critical(self, count: int, since: float) -> bool:
+        """
+        Check the most recent detections for a critical one at or after a time.
+        
+        Args:
+            count: Number of most recent detections to inspect
+            since: Epoch time; older detections are ignored
+            
+        Returns:
+            bool: True if any inspected detection is critical and newer than ``since``
+        """
+        rows = self.recent_rows(count)
+        return bool(np.any(self.critical[rows] & (self.timestamps[rows] > since)))
+    
+    def clear(self) -> None:
+        """Remove all detections."""
+        self._head = 0
+        self._count = 0
+
+
 class SafetyMonitor:
     """
     Standalone safety monitoring system for the Orchestrator platform.
@@ -72,14 +264,7 @@ class SafetyMonitor:
         self.logger = logging_service.get_device_logger("safety_monitor")
         
         # MQTT configuration
-        mqtt_config = MQTTConfig(
-            broker_host=self.config.mqtt.broker_host,
-            broker_port=self.config.mqtt.broker_port,
-            client_id="safety_monitor",
-            username=getattr(self.config.mqtt, 'username', None),
-            password=getattr(self.config.mqtt, 'password', None),
-            keepalive=self.config.mqtt.keepalive
-        )
+        mqtt_config = MQTTConfig.from_config(self.config.mqtt, "safety_monitor")
         
         self.mqtt_client = MQTTClientWrapper(mqtt_config)
         
@@ -91,9 +276,10 @@ class SafetyMonitor:
         
         # Safety zones configuration
         self.safety_zones = self._initialize_safety_zones()
+        self._pack_safety_zones()
         
         # Statistics and monitoring
-        self.obstacle_detections = []
+        self.obstacle_detections = DetectionHistory(500)
         self.emergency_stops_triggered = 0
         self.false_positives = 0
         self.system_start_time = datetime.now()
@@ -102,11 +288,30 @@ class SafetyMonitor:
         self._data_lock = threading.Lock()
         self._stop_event = threading.Event()
         
+        # Pending non-critical status updates, flushed once per monitoring cycle
+        self._status_lock = threading.Lock()
+        self._status_batch = []
+        
         # Performance monitoring
-        self.processing_times = []
+        self.processing_times = deque(maxlen=50)
+        self._processing_time_sum = 0.0
         self.max_processing_time = 0.0
         self.avg_processing_time = 0.0
         
+        # Static part of every status payload, shared rather than rebuilt per status
+        self._status_configuration = {
+            "obstacle_threshold": self.safety_config.obstacle_threshold,
+            "emergency_stop_timeout": self.safety_config.emergency_stop_timeout,
+            "zones_configured": len(self.safety_zones)
+        }
+        
+        # Threads already moved to the configured real-time scheduling
+        self._scheduled_threads = set()
+        
+        # Prime CPU sampling so watchdog reads are non-blocking deltas
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+        
         self.logger.info("Safety monitor initialized")
     
     def _initialize_safety_zones(self) -> List[SafetyZone]:
@@ -147,21 +352,60 @@ class SafetyMonitor:
             action="slow"
         ))
         
-        # Add configured zones from config if available
-        if hasattr(self.safety_config, 'safety_zones'):
-            for zone_config in self.safety_config.safety_zones:
-                zones.append(SafetyZone(
-                    name=zone_config.get('name', 'custom'),
-                    min_angle=zone_config.get('min_angle', 0.0),
-                    max_angle=zone_config.get('max_angle', 360.0),
-                    min_distance=zone_config.get('min_distance', 0.5),
-                    priority=zone_config.get('priority', 3),
-                    action=zone_config.get('action', 'warn')
-                ))
+        # Add configured zones (defaults are applied by SafetyZoneConfig)
+        for zone_config in self.safety_config.safety_zones:
+            zones.append(SafetyZone(
+                name=zone_config.name,
+                min_angle=zone_config.min_angle,
+                max_angle=zone_config.max_angle,
+                min_distance=zone_config.min_distance,
+                priority=zone_config.priority,
+                action=zone_config.action
+            ))
         
         self.logger.info(f"Initialized {len(zones)} safety zones")
         return zones
     
+    def _pack_safety_zones(self) -> None:
+        """Pack zone parameters into arrays for the fused per-scan zone check."""
+        zones = self.safety_zones
+        self._zone_min_angle = np.array([z.min_angle for z in zones], dtype=np.float64)
+        self._zone_max_angle = np.array([z.max_angle for z in zones], dtype=np.float64)
+        self._zone_min_distance = np.array([z.min_distance for z in zones], dtype=np.float64)
+        self._zone_is_stop = np.array([z.action == "stop" for z in zones], dtype=bool)
+        # Stop zones decide the e-stop (phase 1); the rest are only reported (phase 2)
+        self._stop_zone_idx = np.flatnonzero(self._zone_is_stop)
+        self._report_zone_idx = np.flatnonzero(~self._zone_is_stop)
+        self._stop_zone_min_distance = self._zone_min_distance[self._stop_zone_idx]
+        self._report_zone_min_distance = self._zone_min_distance[self._report_zone_idx]
+        self._max_zone_distance = float(self._zone_min_distance.max()) if zones else 0.0
+        
+        # Beam masks depend only on the LiDAR angular grid, rebuilt when it changes
+        self._beam_angles_cached = None
+        self._zone_beam_masks = None
+        self._stop_beam_masks = None
+        self._report_beam_masks = None
+    
+    def _get_zone_beam_masks(self, angles: np.ndarray) -> np.ndarray:
+        """
+        Get the per-zone beam membership masks for a scan's angular grid.
+        
+        Args:
+            angles: Beam angles of the current scan
+            
+        Returns:
+            Boolean matrix of shape (zones, beams)
+        """
+        cached = self._beam_angles_cached
+        if cached is None or cached.shape != angles.shape or not np.array_equal(cached, angles):
+            self._zone_beam_masks = _zone_angle_masks(
+                np.mod(angles, 360.0), self._zone_min_angle, self._zone_max_angle
+            )
+            self._stop_beam_masks = self._zone_beam_masks[self._stop_zone_idx]
+            self._report_beam_masks = self._zone_beam_masks[self._report_zone_idx]
+            self._beam_angles_cached = angles.copy()
+        return self._zone_beam_masks
+    
     def start(self) -> bool:
         """
         Start the safety monitoring system.
@@ -185,9 +429,9 @@ class SafetyMonitor:
                 self.logger.error(f"Failed to subscribe to {lidar_topic}")
                 return False
             
-            # Subscribe to system status for coordination
-            status_topic = "orchestrator/status/+"
-            self.mqtt_client.subscribe(status_topic, self._handle_status_update)
+            # Subscribe to emergency stop acknowledgments only
+            ack_topic = "orchestrator/ack/estop"
+            self.mqtt_client.subscribe(ack_topic, self._handle_estop_ack)
             
             self.running = True
             self._stop_event.clear()
@@ -204,6 +448,7 @@ class SafetyMonitor:
             
             # Publish initial status
             self._publish_safety_status("active", "Safety monitor started")
+            self._flush_safety_status()
             
             return True
             
@@ -228,12 +473,13 @@ class SafetyMonitor:
             if hasattr(self, 'watchdog_thread'):
                 self.watchdog_thread.join(timeout=2.0)
             
+            # Publish final status while still connected
+            self._publish_safety_status("stopped", "Safety monitor stopped")
+            self._flush_safety_status()
+            
             # Disconnect MQTT
             self.mqtt_client.disconnect()
             
-            # Publish final status
-            self._publish_safety_status("stopped", "Safety monitor stopped")
-            
             self.logger.info("Safety monitor stopped")
             
         except Exception as e:
@@ -247,6 +493,9 @@ class SafetyMonitor:
             message_data: MQTT message containing LiDAR scan data
         """
         try:
+            # Scans are processed on the MQTT network thread
+            self._apply_thread_scheduling()
+            
             payload = message_data['payload']
             
             # Extract LiDAR scan data
@@ -266,9 +515,7 @@ class SafetyMonitor:
             # Update current data with thread safety
             with self._data_lock:
                 self.last_lidar_data = lidar_data
-                self.last_lidar_timestamp = datetime.fromisoformat(
-                    lidar_data['timestamp'].replace('Z', '+00:00')
-                )
+                self.last_lidar_timestamp = _parse_lidar_timestamp(lidar_data)
             
             # Process data immediately for critical safety
             self._process_lidar_data(lidar_data)
@@ -276,23 +523,26 @@ class SafetyMonitor:
         except Exception as e:
             self.logger.exception("Error handling LiDAR data")
     
-    def _handle_status_update(self, message_data: Dict[str, Any]) -> None:
+    def _handle_estop_ack(self, message_data: Dict[str, Any]) -> None:
         """
-        Handle system status updates for coordination.
+        Handle emergency stop acknowledgments.
         
         Args:
-            message_data: MQTT message containing status update
+            message_data: MQTT message from orchestrator/ack/estop
         """
         try:
-            topic = message_data['topic']
             payload = message_data['payload']
             
-            # Monitor for emergency stop acknowledgments
-            if 'estop' in topic.lower() and payload.get('status') == 'acknowledged':
+            if payload.get('success', True):
                 self.logger.info("Emergency stop acknowledged by system")
+            else:
+                self.logger.error(
+                    "Emergency stop acknowledgment reported failure (command %s)",
+                    payload.get('command_id')
+                )
                 
         except Exception as e:
-            self.logger.exception("Error handling status update")
+            self.logger.exception("Error handling emergency stop acknowledgment")
     
     def _process_lidar_data(self, lidar_data: Dict[str, Any]) -> None:
         """
@@ -301,143 +551,165 @@ class SafetyMonitor:
         Args:
             lidar_data: Dictionary containing LiDAR scan data
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            ranges = lidar_data['ranges']
-            angles = lidar_data['angles']
+            # One wall-clock read per scan, shared by every detection and the e-stop
+            now = datetime.now()
+            
+            # Convert once per scan; zone checks below operate on these arrays
+            ranges = _as_scan_array(lidar_data['ranges'])
+            angles = _as_scan_array(lidar_data['angles'])
             
-            if len(ranges) != len(angles):
+            if ranges.shape != angles.shape:
                 self.logger.warning("Mismatched ranges and angles in LiDAR data")
                 return
             
-            # Check each safety zone for obstacles
-            critical_obstacles = []
-            warning_obstacles = []
+            self._get_zone_beam_masks(angles)
             
-            for zone in self.safety_zones:
-                obstacles = self._check_zone_for_obstacles(zone, ranges, angles)
-                
-                if obstacles:
-                    for obstacle in obstacles:
-                        detection = ObstacleDetection(
-                            timestamp=datetime.now(),
-                            distance=obstacle[0],
-                            angle=obstacle[1],
-                            zone=zone.name,
-                            severity="critical" if zone.action == "stop" else "warning"
-                        )
-                        
-                        if zone.action == "stop":
-                            critical_obstacles.append(detection)
-                        else:
-                            warning_obstacles.append(detection)
-            
-            # Handle critical obstacles immediately
-            if critical_obstacles:
-                self._trigger_emergency_stop(critical_obstacles)
+            # Radius prefilter: only returns inside the largest zone can hit any zone
+            candidates = np.flatnonzero((ranges >= 0.1) & (ranges <= self._max_zone_distance))
+            candidate_ranges = ranges[candidates]
             
-            # Log warning obstacles
-            for obstacle in warning_obstacles:
-                self.logger.warning(
-                    f"Warning obstacle detected in {obstacle.zone}: "
-                    f"{obstacle.distance:.2f}m at {obstacle.angle:.1f}°"
+            # Phase 1: decide on the e-stop from the stop zones alone and publish it
+            # before any further enumeration or logging
+            critical_zones, critical_points = self._scan_zone_subset(
+                self._stop_zone_idx, self._stop_beam_masks, self._stop_zone_min_distance,
+                candidates, candidate_ranges
+            )
+            critical_distances = ranges[critical_points]
+            critical_angles = angles[critical_points]
+            estop_published = False
+            if critical_points.size:
+                closest = int(np.argmin(critical_distances))
+                estop_published = self._trigger_emergency_stop(
+                    float(critical_distances[closest]), float(critical_angles[closest]),
+                    int(critical_zones[closest]), int(critical_points.size), now
                 )
             
-            # Update statistics
-            self.obstacle_detections.extend(critical_obstacles + warning_obstacles)
+            # Phase 2: enumerate the remaining zones and report
+            warning_zones, warning_points = self._scan_zone_subset(
+                self._report_zone_idx, self._report_beam_masks, self._report_zone_min_distance,
+                candidates, candidate_ranges
+            )
+            warning_distances = ranges[warning_points]
+            warning_angles = angles[warning_points]
             
-            # Limit detection history
-            if len(self.obstacle_detections) > 1000:
-                self.obstacle_detections = self.obstacle_detections[-500:]
+            if estop_published:
+                self._log_critical_obstacles(critical_distances, critical_angles, critical_zones)
+            
+            # Log warning obstacles
+            if warning_zones.size and self.logger.isEnabledFor(logging.WARNING):
+                log_warning = self.logger.warning
+                zones = self.safety_zones
+                for zone_index, distance, angle in zip(warning_zones.tolist(),
+                                                       warning_distances.tolist(),
+                                                       warning_angles.tolist()):
+                    log_warning(
+                        "Warning obstacle detected in %s: %.2fm at %.1f°",
+                        zones[zone_index].name, distance, angle
+                    )
+            
+            # Detections as parallel arrays, one entry per (zone, point) hit
+            zone_indices = np.concatenate((critical_zones, warning_zones))
+            distances = np.concatenate((critical_distances, warning_distances))
+            hit_angles = np.concatenate((critical_angles, warning_angles))
+            critical = np.zeros(zone_indices.size, dtype=bool)
+            critical[:critical_zones.size] = True
+            
+            # Update statistics (bounded history evicts the oldest entries)
+            self.obstacle_detections.append_batch(
+                now.timestamp(), distances, hit_angles, zone_indices, critical
+            )
             
         except Exception as e:
             self.logger.exception("Error processing LiDAR data")
         
         finally:
             # Track processing performance
-            processing_time = time.time() - start_time
-            self.processing_times.append(processing_time)
+            processing_time = time.monotonic() - start_time
+            times = self.processing_times
+            if len(times) == times.maxlen:
+                self._processing_time_sum -= times[0]
+            times.append(processing_time)
+            self._processing_time_sum += processing_time
             
-            if len(self.processing_times) > 100:
-                self.processing_times = self.processing_times[-50:]
-            
-            self.max_processing_time = max(self.max_processing_time, processing_time)
-            self.avg_processing_time = sum(self.processing_times) / len(self.processing_times)
+            if processing_time > self.max_processing_time:
+                self.max_processing_time = processing_time
+            self.avg_processing_time = self._processing_time_sum / len(times)
             
             # Log performance warning if processing is too slow
-            if processing_time > self.safety_config.emergency_stop_timeout * 0.5:
+            estop_timeout = self.safety_config.emergency_stop_timeout
+            if processing_time > estop_timeout * 0.5:
                 self.logger.warning(
-                    f"Slow safety processing: {processing_time:.3f}s "
-                    f"(threshold: {self.safety_config.emergency_stop_timeout:.3f}s)"
+                    "Slow safety processing: %.3fs (threshold: %.3fs)",
+                    processing_time, estop_timeout
                 )
     
-    def _check_zone_for_obstacles(self, zone: SafetyZone, ranges: List[float], 
-                                 angles: List[float]) -> List[Tuple[float, float]]:
+    @staticmethod
+    def _scan_zone_subset(zone_idx: np.ndarray, zone_masks: np.ndarray,
+                          zone_min_distance: np.ndarray, candidates: np.ndarray,
+                          candidate_ranges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Check a specific safety zone for obstacles.
+        Find obstacle hits for a subset of the safety zones.
         
         Args:
-            zone: Safety zone to check
-            ranges: List of distance measurements
-            angles: List of angle measurements
+            zone_idx: Indices of the zones to check
+            zone_masks: Beam masks of those zones for the whole scan
+            zone_min_distance: Detection distance of those zones
+            candidates: Beam indices that passed the radius prefilter
+            candidate_ranges: Ranges of the candidate beams
             
         Returns:
-            List of (distance, angle) tuples for obstacles in the zone
+            Tuple of (zone_indices, point_indices) into safety_zones and the scan
         """
-        obstacles = []
-        
-        for distance, angle in zip(ranges, angles):
-            # Normalize angle to 0-360 range
-            normalized_angle = angle % 360
-            
-            # Check if point is within zone angular range
-            in_zone = False
-            if zone.min_angle <= zone.max_angle:
-                # Normal case: zone doesn't cross 0°
-                in_zone = zone.min_angle <= normalized_angle <= zone.max_angle
-            else:
-                # Zone crosses 0° (e.g., 350° to 10°)
-                in_zone = (normalized_angle >= zone.min_angle or 
-                          normalized_angle <= zone.max_angle)
-            
-            # Check if obstacle is within minimum safe distance
-            if in_zone and 0.1 <= distance <= zone.min_distance:
-                obstacles.append((distance, angle))
-        
-        return obstacles
+        zone_hits, candidate_hits = _scan_all_zones(
+            candidate_ranges, zone_masks[:, candidates], zone_min_distance
+        )
+        return zone_idx[zone_hits], candidates[candidate_hits]
     
-    def _trigger_emergency_stop(self, obstacles: List[ObstacleDetection]) -> None:
+    def _trigger_emergency_stop(self, distance: float, angle: float, zone_index: int,
+                                total_obstacles: int,
+                                now: Optional[datetime] = None) -> bool:
         """
-        Trigger an emergency stop due to critical obstacles.
+        Publish an emergency stop for the closest critical obstacle.
         
         Args:
-            obstacles: List of critical obstacle detections
+            distance: Distance of the closest critical obstacle
+            angle: Angle of the closest critical obstacle
+            zone_index: Safety zone index of the closest critical obstacle
+            total_obstacles: Number of critical detections in the scan
+            now: Scan timestamp to stamp the command with, or None for current time
+            
+        Returns:
+            bool: True if an emergency stop command was published by this call
         """
         try:
             if self.emergency_stop_active:
                 # Already in emergency stop, just log
                 self.logger.debug("Emergency stop already active")
-                return
+                return False
             
             self.emergency_stop_active = True
             self.emergency_stops_triggered += 1
             
-            # Find closest obstacle for reporting
-            closest_obstacle = min(obstacles, key=lambda x: x.distance)
+            zone_name = self.safety_zones[zone_index].name
+            
+            if now is None:
+                now = datetime.now()
             
             # Create emergency stop command
             estop_command = {
-                "timestamp": datetime.now().isoformat(),
-                "command_id": f"safety_estop_{int(time.time())}",
+                "timestamp": now.isoformat(),
+                "command_id": f"safety_estop_{int(now.timestamp())}",
                 "action": "emergency_stop",
                 "reason": "obstacle_detected",
                 "source": "safety_monitor",
                 "obstacle_info": {
-                    "distance": closest_obstacle.distance,
-                    "angle": closest_obstacle.angle,
-                    "zone": closest_obstacle.zone,
-                    "total_obstacles": len(obstacles)
+                    "distance": distance,
+                    "angle": angle,
+                    "zone": zone_name,
+                    "total_obstacles": total_obstacles
                 },
                 "parameters": {
                     "immediate": True,
@@ -449,29 +721,47 @@ class SafetyMonitor:
             estop_topic = "orchestrator/cmd/estop"
             success = self.mqtt_client.publish(estop_topic, estop_command, qos=1)
             
-            if success:
-                self.logger.critical(
-                    f"EMERGENCY STOP TRIGGERED: Obstacle at {closest_obstacle.distance:.2f}m "
-                    f"in {closest_obstacle.zone} zone (angle: {closest_obstacle.angle:.1f}°)"
-                )
-                
-                # Publish safety status
-                self._publish_safety_status(
-                    "emergency_stop",
-                    f"Emergency stop triggered: obstacle at {closest_obstacle.distance:.2f}m"
-                )
-                
-                # Log all obstacles for analysis
-                for obstacle in obstacles:
-                    self.logger.error(
-                        f"Critical obstacle: {obstacle.distance:.2f}m at {obstacle.angle:.1f}° "
-                        f"in {obstacle.zone}"
-                    )
-            else:
+            if not success:
                 self.logger.error("FAILED TO PUBLISH EMERGENCY STOP COMMAND!")
-                
+                return False
+            
+            self.logger.critical(
+                "EMERGENCY STOP TRIGGERED: Obstacle at %.2fm in %s zone (angle: %.1f°)",
+                distance, zone_name, angle
+            )
+            
+            # Publish safety status
+            self._publish_safety_status(
+                "emergency_stop",
+                f"Emergency stop triggered: obstacle at {distance:.2f}m"
+            )
+            return True
+            
         except Exception as e:
             self.logger.exception("Error triggering emergency stop")
+            return False
+    
+    def _log_critical_obstacles(self, distances: np.ndarray, angles: np.ndarray,
+                                zone_indices: np.ndarray) -> None:
+        """
+        Log every critical detection behind an emergency stop for analysis.
+        
+        Args:
+            distances: Distances of the critical detections
+            angles: Angles of the critical detections
+            zone_indices: Safety zone index of each critical detection
+        """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
+        log_error = self.logger.error
+        zones = self.safety_zones
+        for zone_index, distance, angle in zip(zone_indices.tolist(),
+                                               distances.tolist(), angles.tolist()):
+            log_error(
+                "Critical obstacle: %.2fm at %.1f° in %s",
+                distance, angle, zones[zone_index].name
+            )
     
     def _publish_safety_status(self, status: str, message: str) -> None:
         """
@@ -482,33 +772,95 @@ class SafetyMonitor:
             message: Status message
         """
         try:
+            now = datetime.now()
             status_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "device_id": "safety_monitor",
                 "status": status,
                 "message": message,
                 "statistics": {
-                    "uptime_seconds": (datetime.now() - self.system_start_time).total_seconds(),
+                    "uptime_seconds": (now - self.system_start_time).total_seconds(),
                     "emergency_stops_triggered": self.emergency_stops_triggered,
                     "total_detections": len(self.obstacle_detections),
                     "avg_processing_time_ms": self.avg_processing_time * 1000,
                     "max_processing_time_ms": self.max_processing_time * 1000
                 },
-                "configuration": {
-                    "obstacle_threshold": self.safety_config.obstacle_threshold,
-                    "emergency_stop_timeout": self.safety_config.emergency_stop_timeout,
-                    "zones_configured": len(self.safety_zones)
-                }
+                "configuration": self._status_configuration
             }
             
+            with self._status_lock:
+                self._status_batch.append(status_data)
+            
+            # Emergency stops bypass batching and go out immediately
+            if status == "emergency_stop":
+                self._flush_safety_status(qos=1)
+            
+        except Exception as e:
+            self.logger.exception("Error publishing safety status")
+    
+    def _flush_safety_status(self, qos: int = 0) -> None:
+        """
+        Publish all pending safety status updates as a single message.
+        
+        The latest status forms the top-level payload so single-status
+        consumers are unaffected; every pending update is listed in "events".
+        
+        Args:
+            qos: Quality of Service level for the batched message
+        """
+        try:
+            with self._status_lock:
+                if not self._status_batch:
+                    return
+                batch = self._status_batch
+                self._status_batch = []
+            
+            status_data = dict(batch[-1])
+            status_data["batch_format"] = "v1"
+            status_data["batch_size"] = len(batch)
+            status_data["events"] = [
+                {"timestamp": entry["timestamp"], "status": entry["status"], "message": entry["message"]}
+                for entry in batch
+            ]
+            
             topic = "orchestrator/status/safety_monitor"
-            self.mqtt_client.publish(topic, status_data)
+            self.mqtt_client.publish(topic, status_data, qos=qos)
             
         except Exception as e:
             self.logger.exception("Error publishing safety status")
     
+    def _apply_thread_scheduling(self) -> None:
+        """
+        Apply the configured real-time priority and CPU affinity to the calling thread.
+        
+        Runs once per thread; failures (missing CAP_SYS_NICE, non-Linux
+        platforms) are logged and monitoring continues at normal priority.
+        """
+        thread_id = threading.get_ident()
+        if thread_id in self._scheduled_threads:
+            return
+        self._scheduled_threads.add(thread_id)
+        
+        priority = self.safety_config.realtime_priority
+        affinity = self.safety_config.cpu_affinity
+        
+        if priority is not None:
+            try:
+                # pid 0 targets the calling thread on Linux
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            except (AttributeError, OSError) as e:
+                self.logger.warning("Could not set SCHED_FIFO priority %d: %s", priority, e)
+        
+        if affinity:
+            try:
+                os.sched_setaffinity(0, set(affinity))
+            except (AttributeError, OSError) as e:
+                self.logger.warning("Could not pin safety thread to CPUs %s: %s", affinity, e)
+    
     def _monitoring_loop(self) -> None:
         """Main monitoring loop for periodic safety checks."""
+        self._apply_thread_scheduling()
+        
         while self.running and not self._stop_event.is_set():
             try:
                 # Check for data timeout
@@ -520,6 +872,9 @@ class SafetyMonitor:
                 # Reset emergency stop if conditions are clear
                 self._check_emergency_stop_reset()
                 
+                # Send this cycle's status updates as one message
+                self._flush_safety_status()
+                
                 # Sleep for monitoring interval
                 self._stop_event.wait(5.0)  # 5-second monitoring cycle
                 
@@ -577,14 +932,8 @@ class SafetyMonitor:
             if self.last_lidar_data is None:
                 return
             
-            # Simple check: no recent critical detections
-            recent_critical = [
-                d for d in self.obstacle_detections[-10:]  # Last 10 detections
-                if d.severity == "critical" and 
-                (datetime.now() - d.timestamp).total_seconds() < 3.0
-            ]
-            
-            if not recent_critical:
+            # Simple check: no critical detection among the last 10 within 3 seconds
+            if not self.obstacle_detections.has_recent_critical(10, time.time() - 3.0):
                 self.emergency_stop_active = False
                 self.logger.info("Emergency stop condition cleared")
                 self._publish_safety_status("monitoring", "Emergency stop cleared")
@@ -596,20 +945,20 @@ class SafetyMonitor:
             if not self.mqtt_client.is_connected:
                 self.logger.error("MQTT connection lost - safety monitoring compromised")
             
+            # psutil not available, skip system checks
+            if psutil is None:
+                return
+            
             # Check memory usage (basic check)
-            import psutil
             memory_percent = psutil.virtual_memory().percent
             if memory_percent > 90:
                 self.logger.warning(f"High memory usage: {memory_percent:.1f}%")
             
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Check CPU usage since the previous watchdog cycle (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             if cpu_percent > 80:
                 self.logger.warning(f"High CPU usage: {cpu_percent:.1f}%")
                 
-        except ImportError:
-            # psutil not available, skip system checks
-            pass
         except Exception as e:
             self.logger.exception("Error checking system health")
 
@@ -8,33 +8,42 @@ the official robot state to orchestrator/status/robot.
 Requirements covered: 4.3, 5.4
 """
 
+import functools
 import json
 import math
+import sys
 import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
+import numpy as np
+
 from .mqtt_client import MQTTClientWrapper, MQTTConfig
 from .logging_service import get_logging_service
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Position:
     """Robot position in 2D space"""
     x: float = 0.0
     y: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Velocity:
     """Robot velocity components"""
     linear: float = 0.0  # m/s forward velocity
     angular: float = 0.0  # rad/s rotational velocity
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RobotState:
     """Complete robot state information"""
     position: Position
@@ -47,6 +56,55 @@ class RobotState:
     encoder_data: Optional[Dict[str, Any]] = None
 
 
+def _integrate_motion(x: float, y: float, heading: float, delta_distances: np.ndarray,
+                      delta_headings: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    Dead-reckon a sequence of differential drive motion samples in one pass.
+    
+    Each sample turns by its heading delta and then moves its distance along
+    the new heading, the same as applying the samples one at a time.
+    
+    Args:
+        x: Starting X position in meters
+        y: Starting Y position in meters
+        heading: Starting heading in radians
+        delta_distances: Distance travelled in each sample
+        delta_headings: Heading change in each sample
+        
+    Returns:
+        Tuple of (x, y, heading, sin(heading), cos(heading)) after the last
+        sample, with heading normalized to [-pi, pi]
+    """
+    headings = heading + np.cumsum(delta_headings)
+    cos_headings = np.cos(headings)
+    sin_headings = np.sin(headings)
+    x += float(np.dot(delta_distances, cos_headings))
+    y += float(np.dot(delta_distances, sin_headings))
+    return (x, y, math.remainder(float(headings[-1]), math.tau),
+            float(sin_headings[-1]), float(cos_headings[-1]))
+
+
+def _safe_callback(description: str):
+    """
+    Wrap an MQTT message handler so exceptions are logged, not raised.
+    
+    Args:
+        description: What the handler processes, used in the log message
+        
+    Returns:
+        Decorator for StateManager handler methods
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, message_data: Dict[str, Any]):
+            try:
+                handler(self, message_data)
+            except Exception:
+                self.logger.exception(f"Error handling {description}")
+        return wrapper
+    return decorator
+
+
 class StateManager:
     """
     State Management Service for robot odometry and status tracking.
@@ -60,7 +118,7 @@ class StateManager:
     """
     
     def __init__(self, mqtt_config: MQTTConfig, wheel_base: float = 0.3, 
-                 publish_rate: float = 10.0):
+                 publish_rate: float = 10.0, heartbeat_interval: float = 2.0):
         """
         Initialize the state manager.
         
@@ -68,41 +126,89 @@ class StateManager:
             mqtt_config: MQTT configuration for communication
             wheel_base: Distance between wheels in meters
             publish_rate: Rate to publish state updates (Hz)
+            heartbeat_interval: Maximum time between publishes while the
+                state is unchanged (seconds)
         """
         self.mqtt_client = MQTTClientWrapper(mqtt_config)
         self.wheel_base = wheel_base
+        self._inv_wheel_base = 1.0 / wheel_base  # wheel_base is fixed per instance
         self.publish_rate = publish_rate
+        self.heartbeat_interval = heartbeat_interval
         
         # Initialize logging
         logging_service = get_logging_service()
         self.logger = logging_service.get_device_logger("state_manager")
         
-        # Robot state
+        # Robot state snapshot. Writers serialize on _state_lock and swap in a
+        # new RobotState (never mutating the current one), so readers can take
+        # self.robot_state without locking. last_updated is kept as an epoch
+        # float on the update paths and formatted to ISO only when read.
+        self._last_updated_ts = time.time()
+        self._last_updated_cache = (None, "")
+        self._snapshot_cache = (None, None)
+        self._state_dirty = True  # state changed since the last publish
         self.robot_state = RobotState(
             position=Position(),
             heading=0.0,
             velocity=Velocity(),
             status="idle",
             mission_status="idle",
-            last_updated=datetime.now().isoformat()
+            last_updated=datetime.fromtimestamp(self._last_updated_ts).isoformat()
         )
         
         # Encoder tracking
+        self._encoder_sides = {
+            "orchestrator/data/left_encoder": "left",
+            "orchestrator/data/right_encoder": "right"
+        }
         self.left_encoder_data: Optional[Dict[str, Any]] = None
         self.right_encoder_data: Optional[Dict[str, Any]] = None
         self.last_left_distance = 0.0
         self.last_right_distance = 0.0
         self.last_update_time = time.time()
         
+        # Encoder motion (delta_distance, delta_heading, time) not yet folded
+        # into the pose; encoder callbacks append, the publish loop drains
+        # under _state_lock. The deque is never rebound, so an append can't
+        # land on a queue that has already been taken
+        self._pending_samples = deque()
+        
+        # sin/cos of the current heading, refreshed only when the heading changes
+        self._sin_heading = 0.0
+        self._cos_heading = 1.0
+        
         # State management
         self._running = False
         self._publish_thread: Optional[threading.Thread] = None
-        self._state_lock = threading.Lock()
+        self._metrics_thread: Optional[threading.Thread] = None
+        self._metrics_stop = threading.Event()
+        self._state_lock = threading.Lock()  # serializes writers only
         
         # Performance tracking
         self.update_count = 0
         self.last_encoder_update = 0.0
         
+        # Performance metrics (name, value, unit) queued by the publish path
+        # and written to the logger by the metrics thread; oldest entries are
+        # dropped if the logger falls behind
+        self._metric_ring = deque(maxlen=1024)
+        
+        # Robot state message, allocated once and refilled on every publish
+        self._publish_buf: Dict[str, Any] = {
+            'position': {'x': 0.0, 'y': 0.0},
+            'heading': 0.0,
+            'velocity': {'linear': 0.0, 'angular': 0.0},
+            'status': '',
+            'mission_status': '',
+            'last_updated': '',
+            'odometry_valid': True,
+            'encoder_data': None,
+            'wheel_base': wheel_base,
+            'update_count': 0,
+            'last_encoder_update': 0.0,
+            'publish_rate': publish_rate
+        }
+        
         self.logger.info(f"StateManager initialized with wheel_base={wheel_base}m, publish_rate={publish_rate}Hz")
     
     def start(self) -> bool:
@@ -129,10 +235,16 @@ class StateManager:
             self._publish_thread = threading.Thread(target=self._publish_loop, daemon=True)
             self._publish_thread.start()
             
+            # Start metrics drain thread
+            self._metrics_stop.clear()
+            self._metrics_thread = threading.Thread(target=self._metrics_loop, daemon=True)
+            self._metrics_thread.start()
+            
             # Update status
             with self._state_lock:
-                self.robot_state.status = "active"
-                self.robot_state.last_updated = datetime.now().isoformat()
+                self._last_updated_ts = time.time()
+                self.robot_state = replace(self.robot_state, status="active")
+                self._state_dirty = True
             
             self.logger.info("StateManager started successfully")
             return True
@@ -149,15 +261,22 @@ class StateManager:
             # Stop publishing thread
             if self._publish_thread:
                 self._publish_thread.join(timeout=5.0)
+            self._metrics_stop.set()
+            if self._metrics_thread:
+                self._metrics_thread.join(timeout=5.0)
             
             # Update status
             with self._state_lock:
-                self.robot_state.status = "stopped"
-                self.robot_state.last_updated = datetime.now().isoformat()
+                self._last_updated_ts = time.time()
+                self.robot_state = replace(self.robot_state, status="stopped")
+                self._state_dirty = True
             
             # Publish final state
             self._publish_state()
             
+            # Write out any metrics queued since the last drain
+            self._drain_metrics()
+            
             # Disconnect MQTT
             self.mqtt_client.disconnect()
             
@@ -168,23 +287,8 @@ class StateManager:
     
     def _subscribe_to_encoders(self):
         """Subscribe to encoder telemetry data."""
-        # Subscribe to left encoder
-        self.mqtt_client.subscribe(
-            "orchestrator/data/left_encoder",
-            self._handle_left_encoder_data
-        )
-        
-        # Subscribe to right encoder  
-        self.mqtt_client.subscribe(
-            "orchestrator/data/right_encoder", 
-            self._handle_right_encoder_data
-        )
-        
-        # Subscribe to any encoder data (fallback)
-        self.mqtt_client.subscribe(
-            "orchestrator/data/+encoder",
-            self._handle_encoder_data
-        )
+        for topic in self._encoder_sides:
+            self.mqtt_client.subscribe(topic, self._handle_encoder_data)
         
         self.logger.info("Subscribed to encoder telemetry topics")
     
@@ -203,171 +307,172 @@ class StateManager:
         
         self.logger.info("Subscribed to state management command topics")
     
-    def _handle_left_encoder_data(self, message_data: Dict[str, Any]):
-        """Handle left encoder telemetry data."""
-        try:
-            payload = message_data['payload']
-            encoder_data = payload.get('data', {})
-            
+    @_safe_callback("encoder data")
+    def _handle_encoder_data(self, message_data: Dict[str, Any]):
+        """Handle left or right encoder telemetry data."""
+        # Only topics from _encoder_sides are subscribed to this handler
+        side = self._encoder_sides[message_data['topic']]
+        encoder_data = message_data['payload']['data']
+        
+        if side == 'left':
             self.left_encoder_data = encoder_data
-            self.last_encoder_update = time.time()
-            
-            # Update odometry if we have both encoders
-            if self.right_encoder_data:
-                self._update_odometry()
-                
-        except Exception as e:
-            self.logger.exception("Error handling left encoder data")
-    
-    def _handle_right_encoder_data(self, message_data: Dict[str, Any]):
-        """Handle right encoder telemetry data."""
-        try:
-            payload = message_data['payload']
-            encoder_data = payload.get('data', {})
-            
+        else:
             self.right_encoder_data = encoder_data
-            self.last_encoder_update = time.time()
-            
-            # Update odometry if we have both encoders
-            if self.left_encoder_data:
-                self._update_odometry()
-                
-        except Exception as e:
-            self.logger.exception("Error handling right encoder data")
-    
-    def _handle_encoder_data(self, message_data: Dict[str, Any]):
-        """Handle generic encoder data (fallback handler)."""
-        try:
-            topic = message_data['topic']
-            payload = message_data['payload']
-            encoder_data = payload.get('data', {})
-            
-            # Determine which encoder based on topic or device_id
-            device_id = payload.get('device_id', '')
-            
-            if 'left' in topic.lower() or 'left' in device_id.lower():
-                self.left_encoder_data = encoder_data
-            elif 'right' in topic.lower() or 'right' in device_id.lower():
-                self.right_encoder_data = encoder_data
-            else:
-                # If we can't determine which encoder, log warning
-                self.logger.warning(f"Cannot determine encoder side for topic: {topic}")
-                return
-            
-            self.last_encoder_update = time.time()
-            
-            # Update odometry if we have both encoders
-            if self.left_encoder_data and self.right_encoder_data:
-                self._update_odometry()
-                
-        except Exception as e:
-            self.logger.exception("Error handling generic encoder data")
+        self.last_encoder_update = time.time()
+        
+        # Queue odometry input once we have both encoders
+        if self.left_encoder_data and self.right_encoder_data:
+            self._record_encoder_sample()
     
+    @_safe_callback("state management command")
     def _handle_command(self, message_data: Dict[str, Any]):
         """Handle state management commands."""
-        try:
-            payload = message_data['payload']
-            action = payload.get('action', '')
-            
-            if action == 'reset_odometry':
-                self._reset_odometry()
-            elif action == 'set_position':
-                x = payload.get('x', 0.0)
-                y = payload.get('y', 0.0)
-                heading = payload.get('heading', 0.0)
-                self._set_position(x, y, heading)
-            elif action == 'set_status':
-                status = payload.get('status', 'idle')
-                self._set_status(status)
-            else:
-                self.logger.warning(f"Unknown command action: {action}")
-                
-        except Exception as e:
-            self.logger.exception("Error handling state management command")
+        payload = message_data['payload']
+        action = payload.get('action', '')
+        
+        if action == 'reset_odometry':
+            self._reset_odometry()
+        elif action == 'set_position':
+            x = payload.get('x', 0.0)
+            y = payload.get('y', 0.0)
+            heading = payload.get('heading', 0.0)
+            self._set_position(x, y, heading)
+        elif action == 'set_status':
+            status = payload.get('status', 'idle')
+            self._set_status(status)
+        else:
+            self.logger.warning(f"Unknown command action: {action}")
     
+    @_safe_callback("emergency stop")
     def _handle_emergency_stop(self, message_data: Dict[str, Any]):
         """Handle emergency stop commands."""
-        try:
-            with self._state_lock:
-                self.robot_state.status = "emergency_stop"
-                self.robot_state.velocity = Velocity(0.0, 0.0)
-                self.robot_state.last_updated = datetime.now().isoformat()
-            
-            self.logger.warning("Emergency stop activated")
-            
-        except Exception as e:
-            self.logger.exception("Error handling emergency stop")
+        with self._state_lock:
+            self._last_updated_ts = time.time()
+            self.robot_state = replace(
+                self.robot_state, status="emergency_stop", velocity=Velocity(0.0, 0.0)
+            )
+            self._state_dirty = True
+        
+        self.logger.warning("Emergency stop activated")
+    
+    def _record_encoder_sample(self):
+        """
+        Queue the wheel motion since the previous encoder sample.
+        
+        Runs on every encoder message; the pose itself is only integrated
+        by _update_odometry at publish time.
+        """
+        current_time = time.time()
+        
+        # Get current distances from encoders
+        left_distance = self.left_encoder_data.get('total_distance', 0.0)
+        right_distance = self.right_encoder_data.get('total_distance', 0.0)
+        
+        # Calculate distance deltas
+        delta_left = left_distance - self.last_left_distance
+        delta_right = right_distance - self.last_right_distance
+        self.last_left_distance = left_distance
+        self.last_right_distance = right_distance
+        
+        # Calculate robot motion
+        delta_distance = (delta_left + delta_right) * 0.5  # Average distance
+        delta_heading = (delta_right - delta_left) * self._inv_wheel_base  # Differential heading
+        
+        # deque.append is thread-safe and the deque is only drained in place
+        self._pending_samples.append((delta_distance, delta_heading, current_time))
     
     def _update_odometry(self):
-        """Update robot odometry based on encoder data."""
+        """Integrate queued encoder samples into the robot pose."""
         try:
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            
-            if dt < 0.001:  # Avoid division by very small numbers
-                return
-            
-            # Get current distances from encoders
-            left_distance = self.left_encoder_data.get('total_distance', 0.0)
-            right_distance = self.right_encoder_data.get('total_distance', 0.0)
-            
-            # Calculate distance deltas
-            delta_left = left_distance - self.last_left_distance
-            delta_right = right_distance - self.last_right_distance
-            
-            # Calculate robot motion
-            delta_distance = (delta_left + delta_right) / 2.0  # Average distance
-            delta_heading = (delta_right - delta_left) / self.wheel_base  # Differential heading
-            
             with self._state_lock:
-                # Update heading
-                self.robot_state.heading += delta_heading
+                # Drain under the lock so a reset or set_position can't slip in
+                # between taking the samples and applying them; samples
+                # appended during the drain are kept for the next update
+                pending = self._pending_samples
+                samples = []
+                while pending:
+                    samples.append(pending.popleft())
+                if not samples:
+                    return
                 
-                # Normalize heading to [-pi, pi]
-                while self.robot_state.heading > math.pi:
-                    self.robot_state.heading -= 2 * math.pi
-                while self.robot_state.heading < -math.pi:
-                    self.robot_state.heading += 2 * math.pi
+                state = self.robot_state
+                x = state.position.x
+                y = state.position.y
+                heading = state.heading
                 
-                # Update position (using current heading for direction)
-                self.robot_state.position.x += delta_distance * math.cos(self.robot_state.heading)
-                self.robot_state.position.y += delta_distance * math.sin(self.robot_state.heading)
+                if len(samples) == 1:
+                    # Single sample: scalar math beats NumPy call overhead
+                    total_distance, total_heading, current_time = samples[0]
+                    if total_heading:
+                        # Update heading, normalized to [-pi, pi]
+                        heading = math.remainder(heading + total_heading, math.tau)
+                        
+                        self._sin_heading = math.sin(heading)
+                        self._cos_heading = math.cos(heading)
+                    
+                    # Update position (using current heading for direction)
+                    x += total_distance * self._cos_heading
+                    y += total_distance * self._sin_heading
+                else:
+                    motion = np.array(samples, dtype=np.float64)
+                    x, y, heading, self._sin_heading, self._cos_heading = _integrate_motion(
+                        x, y, heading, motion[:, 0], motion[:, 1]
+                    )
+                    total_distance = float(motion[:, 0].sum())
+                    total_heading = float(motion[:, 1].sum())
+                    current_time = samples[-1][2]
                 
-                # Update velocities
-                self.robot_state.velocity.linear = delta_distance / dt
-                self.robot_state.velocity.angular = delta_heading / dt
+                # Velocities over the span covered by this batch
+                dt = current_time - self.last_update_time
+                if dt >= 0.001:  # Avoid division by very small numbers
+                    velocity = Velocity(total_distance / dt, total_heading / dt)
+                else:
+                    velocity = state.velocity
                 
-                # Update metadata
-                self.robot_state.last_updated = datetime.now().isoformat()
-                self.robot_state.odometry_valid = True
-                self.robot_state.encoder_data = {
-                    'left': self.left_encoder_data,
-                    'right': self.right_encoder_data
-                }
+                self._last_updated_ts = current_time
+                self.robot_state = replace(
+                    state,
+                    position=Position(x, y),
+                    heading=heading,
+                    velocity=velocity,
+                    odometry_valid=True,
+                    # Summary only; full encoder telemetry stays on the encoder topics
+                    encoder_data={
+                        'left_total': self.last_left_distance,
+                        'right_total': self.last_right_distance,
+                        'last_update_ts': self.last_encoder_update
+                    }
+                )
+                self._state_dirty = True
             
             # Update tracking variables
-            self.last_left_distance = left_distance
-            self.last_right_distance = right_distance
             self.last_update_time = current_time
-            self.update_count += 1
+            previous_count = self.update_count
+            self.update_count += len(samples)
             
-            # Log performance metrics periodically
-            if self.update_count % 100 == 0:
-                self.logger.log_performance_metric("odometry_update_rate", 1.0/dt, "Hz")
+            # Queue performance metrics periodically; the metrics thread logs them
+            if self.update_count // 100 != previous_count // 100 and dt >= 0.001:
+                self._metric_ring.append(("odometry_update_rate", len(samples) / dt, "Hz"))
                 
         except Exception as e:
             self.logger.exception("Error updating odometry")
             with self._state_lock:
-                self.robot_state.odometry_valid = False
+                self.robot_state = replace(self.robot_state, odometry_valid=False)
+                self._state_dirty = True
     
     def _reset_odometry(self):
         """Reset odometry to origin."""
         try:
             with self._state_lock:
-                self.robot_state.position = Position(0.0, 0.0)
-                self.robot_state.heading = 0.0
-                self.robot_state.velocity = Velocity(0.0, 0.0)
-                self.robot_state.last_updated = datetime.now().isoformat()
+                self._last_updated_ts = time.time()
+                self.robot_state = replace(
+                    self.robot_state, position=Position(0.0, 0.0), heading=0.0,
+                    velocity=Velocity(0.0, 0.0)
+                )
+                self._state_dirty = True
+                self._sin_heading = 0.0
+                self._cos_heading = 1.0
+                self._pending_samples.clear()
             
             # Reset tracking variables
             if self.left_encoder_data:
@@ -384,10 +489,14 @@ class StateManager:
         """Set robot position manually."""
         try:
             with self._state_lock:
-                self.robot_state.position.x = x
-                self.robot_state.position.y = y
-                self.robot_state.heading = heading
-                self.robot_state.last_updated = datetime.now().isoformat()
+                self._last_updated_ts = time.time()
+                self.robot_state = replace(
+                    self.robot_state, position=Position(x, y), heading=heading
+                )
+                self._state_dirty = True
+                self._sin_heading = math.sin(heading)
+                self._cos_heading = math.cos(heading)
+                self._pending_samples.clear()
             
             self.logger.info(f"Position set to ({x:.3f}, {y:.3f}), heading={heading:.3f}")
             
@@ -404,8 +513,9 @@ class StateManager:
             
             with self._state_lock:
                 old_status = self.robot_state.status
-                self.robot_state.status = status
-                self.robot_state.last_updated = datetime.now().isoformat()
+                self._last_updated_ts = time.time()
+                self.robot_state = replace(self.robot_state, status=status)
+                self._state_dirty = True
             
             self.logger.info(f"Status changed from {old_status} to {status}")
             
@@ -415,42 +525,66 @@ class StateManager:
     def _publish_loop(self):
         """Main loop for publishing robot state."""
         interval = 1.0 / self.publish_rate
+        deadline = time.monotonic()
+        last_publish = float('-inf')
         
         while self._running:
             try:
-                start_time = time.time()
-                
-                self._publish_state()
+                # Publish on change; an unchanged state is only re-sent as a heartbeat
+                if (self._state_dirty or self._pending_samples
+                        or deadline - last_publish >= self.heartbeat_interval):
+                    self._publish_state()
+                    last_publish = deadline
                 
-                # Calculate sleep time to maintain publish rate
-                elapsed = time.time() - start_time
-                sleep_time = max(0, interval - elapsed)
-                time.sleep(sleep_time)
+                # Sleep until the next absolute deadline so the rate doesn't drift
+                deadline += interval
+                sleep_time = deadline - time.monotonic()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                else:
+                    # Overran a whole period: resync instead of bursting to catch up
+                    deadline = time.monotonic()
                 
             except Exception as e:
                 self.logger.exception("Error in state publish loop")
                 time.sleep(interval)
+                deadline = time.monotonic()
+    
+    def _metrics_loop(self):
+        """Periodically write queued performance metrics to the logger."""
+        while not self._metrics_stop.wait(1.0):
+            self._drain_metrics()
+    
+    def _drain_metrics(self):
+        """Log and remove all queued performance metrics."""
+        ring = self._metric_ring
+        try:
+            while ring:
+                metric_name, value, unit = ring.popleft()
+                self.logger.log_performance_metric(metric_name, value, unit)
+        except Exception as e:
+            self.logger.exception("Error logging performance metrics")
     
     def _publish_state(self):
         """Publish current robot state to MQTT."""
         try:
+            # Fold encoder samples received since the last publish into the pose
+            self._update_odometry()
+            
+            # Writers swap the snapshot and then set the flag under the lock,
+            # so clearing it under the lock means any change not in the
+            # snapshot read below sets it again for the next publish
             with self._state_lock:
-                # Create state message
-                state_dict = asdict(self.robot_state)
-                
-                # Add additional metadata
-                state_dict.update({
-                    'wheel_base': self.wheel_base,
-                    'update_count': self.update_count,
-                    'last_encoder_update': self.last_encoder_update,
-                    'publish_rate': self.publish_rate
-                })
+                self._state_dirty = False
+            
+            # Create state message with additional metadata
+            state_dict = self._state_to_dict()
             
             # Publish to MQTT
             success = self.mqtt_client.publish(
                 "orchestrator/status/robot",
                 state_dict,
-                qos=1  # Ensure delivery for status updates
+                qos=0  # State is republished every 1/publish_rate s, so a dropped message self-heals
             )
             
             if not success:
@@ -459,20 +593,71 @@ class StateManager:
         except Exception as e:
             self.logger.exception("Error publishing robot state")
     
+    def _format_last_updated(self) -> str:
+        """
+        Get the last update time as an ISO string, formatting it only when it changed.
+        
+        Returns:
+            ISO-8601 timestamp of the latest state update
+        """
+        timestamp = self._last_updated_ts
+        cached_timestamp, formatted = self._last_updated_cache
+        if timestamp != cached_timestamp:
+            formatted = datetime.fromtimestamp(timestamp).isoformat()
+            self._last_updated_cache = (timestamp, formatted)
+        return formatted
+    
+    def _state_to_dict(self) -> Dict[str, Any]:
+        """
+        Fill the reusable publish buffer from the current robot state.
+        
+        Equivalent to ``asdict(self.robot_state)`` plus service metadata, but
+        writes the known fields into dicts allocated once in __init__. The
+        returned dict is overwritten by the next call, so it must be
+        serialized (MQTTClientWrapper.publish does so synchronously) before
+        then; only the publish path calls this.
+        
+        Returns:
+            Dictionary ready for publishing to orchestrator/status/robot
+        """
+        state = self.robot_state
+        buf = self._publish_buf
+        position = buf['position']
+        position['x'] = state.position.x
+        position['y'] = state.position.y
+        velocity = buf['velocity']
+        velocity['linear'] = state.velocity.linear
+        velocity['angular'] = state.velocity.angular
+        buf['heading'] = state.heading
+        buf['status'] = state.status
+        buf['mission_status'] = state.mission_status
+        buf['last_updated'] = self._format_last_updated()
+        buf['odometry_valid'] = state.odometry_valid
+        buf['encoder_data'] = state.encoder_data
+        buf['update_count'] = self.update_count
+        buf['last_encoder_update'] = self.last_encoder_update
+        # The buffer outlives one publish, so stamp it here rather than
+        # letting the client add a timestamp only once
+        buf['timestamp'] = datetime.now().isoformat()
+        return buf
+    
     def get_current_state(self) -> RobotState:
-        """Get current robot state (thread-safe)."""
-        with self._state_lock:
-            # Return a copy to avoid external modification
-            return RobotState(
-                position=Position(self.robot_state.position.x, self.robot_state.position.y),
-                heading=self.robot_state.heading,
-                velocity=Velocity(self.robot_state.velocity.linear, self.robot_state.velocity.angular),
-                status=self.robot_state.status,
-                mission_status=self.robot_state.mission_status,
-                last_updated=self.robot_state.last_updated,
-                odometry_valid=self.robot_state.odometry_valid,
-                encoder_data=self.robot_state.encoder_data
-            )
+        """
+        Get current robot state (lock-free snapshot read).
+        
+        The returned RobotState is immutable and shared between callers; use
+        dataclasses.replace to derive a modified copy.
+        
+        Returns:
+            Snapshot of the robot state with last_updated filled in
+        """
+        state = self.robot_state
+        source, snapshot = self._snapshot_cache
+        if source is not state:
+            # Stamp last_updated once per state change rather than per call
+            snapshot = replace(state, last_updated=self._format_last_updated())
+            self._snapshot_cache = (state, snapshot)
+        return snapshot
     
     def get_status(self) -> Dict[str, Any]:
         """Get service status information."""
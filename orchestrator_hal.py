@@ -13,6 +13,7 @@ import sys
 import signal
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
@@ -50,6 +51,7 @@ class HALOrchestrator:
         self.config: Optional[OrchestratorConfig] = None
         self.mqtt_client: Optional[MQTTClientWrapper] = None
         self.devices: Dict[str, Device] = {}
+        self._devices_lock = threading.Lock()  # device init runs on worker threads
         self.running = False
         self.shutdown_event = threading.Event()
         
@@ -149,13 +151,9 @@ class HALOrchestrator:
             return True
             
         try:
-            mqtt_config = MQTTConfig(
-                broker_host=self.config.mqtt.broker_host,
-                broker_port=self.config.mqtt.broker_port,
-                keepalive=self.config.mqtt.keepalive,
-                client_id=self.config.mqtt.client_id or "orchestrator_hal",
-                username=self.config.mqtt.username,
-                password=self.config.mqtt.password
+            mqtt_config = MQTTConfig.from_config(
+                self.config.mqtt,
+                client_id=self.config.mqtt.client_id or "orchestrator_hal"
             )
             
             self.mqtt_client = MQTTClientWrapper(mqtt_config)
@@ -202,17 +200,31 @@ class HALOrchestrator:
             return True
             
         try:
-            # Initialize motors
-            for motor_config in self.config.motors:
-                if not self._initialize_motor(motor_config):
-                    self.logger.error(f"Failed to initialize motor: {motor_config.name}")
+            # Device init mostly waits on hardware (GPIO setup, serial
+            # handshakes), so run it concurrently instead of one after another
+            jobs = [(self._initialize_motor, motor_config, "motor")
+                    for motor_config in self.config.motors]
+            jobs += [(self._initialize_sensor, sensor_config, "sensor")
+                     for sensor_config in self.config.sensors]
+            if not jobs:
+                self.logger.info("No devices configured")
+                return True
+            
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs)),
+                                    thread_name_prefix="device_init") as executor:
+                results = list(executor.map(lambda job: job[0](job[1]), jobs))
+            
+            for (_, device_config, kind), initialized in zip(jobs, results):
+                if not initialized:
+                    self.logger.error(f"Failed to initialize {kind}: {device_config.name}")
                     return False
             
-            # Initialize sensors
-            for sensor_config in self.config.sensors:
-                if not self._initialize_sensor(sensor_config):
-                    self.logger.error(f"Failed to initialize sensor: {sensor_config.name}")
-                    return False
+            # Keep configuration order (motors, then sensors) regardless of
+            # which device finished first
+            self.devices = {
+                device_config.name: self.devices[device_config.name]
+                for _, device_config, _ in jobs
+            }
             
             self.logger.info(f"Initialized {len(self.devices)} devices successfully")
             return True
@@ -236,7 +248,8 @@ class HALOrchestrator:
                 self.logger.error(f"Motor {motor_config.name} initialization failed")
                 return False
             
-            self.devices[motor_config.name] = motor
+            with self._devices_lock:
+                self.devices[motor_config.name] = motor
             self.logger.info(f"Motor {motor_config.name} initialized successfully")
             return True
             
@@ -270,7 +283,8 @@ class HALOrchestrator:
                 self.logger.error(f"Sensor {sensor_config.name} initialization failed")
                 return False
             
-            self.devices[sensor_config.name] = sensor
+            with self._devices_lock:
+                self.devices[sensor_config.name] = sensor
             self.logger.info(f"Sensor {sensor_config.name} initialized successfully")
             return True
             
@@ -282,28 +296,27 @@ class HALOrchestrator:
         """
         Main run loop for the HAL orchestrator.
         
-        Monitors system health and publishes status updates.
+        Sleeps on the shutdown event until the next heartbeat is due, then
+        publishes the heartbeat and checks device health.
         """
         try:
             self.logger.info("HAL Orchestrator started, entering main loop...")
             self._publish_system_status("running")
             
             heartbeat_interval = self.config.system.heartbeat_interval
-            last_heartbeat = time.time()
+            last_heartbeat = time.monotonic()
             
-            while self.running and not self.shutdown_event.is_set():
-                current_time = time.time()
+            while True:
+                # Wake when the next heartbeat is due, or immediately on shutdown
+                timeout = max(0.0, heartbeat_interval - (time.monotonic() - last_heartbeat))
+                if self.shutdown_event.wait(timeout):
+                    break
                 
-                # Send heartbeat
-                if current_time - last_heartbeat >= heartbeat_interval:
-                    self._send_heartbeat()
-                    last_heartbeat = current_time
+                last_heartbeat = time.monotonic()
+                self._send_heartbeat()
                 
-                # Check device health
+                # Device health is checked on the heartbeat cadence
                 self._check_device_health()
-                
-                # Sleep for a short interval
-                time.sleep(1.0)
             
             self.logger.info("HAL Orchestrator main loop exited")
             
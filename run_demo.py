@@ -6,6 +6,7 @@ Provides easy access to run demo and validation scripts.
 
 import sys
 import os
+import runpy
 import subprocess
 from pathlib import Path
 
@@ -19,8 +20,26 @@ def list_demos():
     demo_files = list(demos_dir.glob("*.py"))
     return sorted([f.name for f in demo_files])
 
-def run_demo(demo_name):
-    """Run a specific demo script."""
+def _exit_code(code):
+    """Convert a SystemExit code to a process return code."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code)
+    return 1
+
+def run_demo(demo_name, use_subprocess=False):
+    """
+    Run a specific demo script.
+    
+    Args:
+        demo_name: File name of the demo in the demos directory
+        use_subprocess: Run the demo in a fresh interpreter instead of in-process
+    
+    Returns:
+        Return code of the demo
+    """
     demo_path = Path("demos") / demo_name
     if not demo_path.exists():
         print(f"Demo '{demo_name}' not found")
@@ -30,15 +49,27 @@ def run_demo(demo_name):
     project_root = Path(__file__).parent
     sys.path.insert(0, str(project_root))
     
-    cmd = [sys.executable, str(demo_path)]
-    
     print(f"Running demo: {demo_name}")
-    print(f"Command: {' '.join(cmd)}")
+    if use_subprocess:
+        cmd = [sys.executable, str(demo_path)]
+        print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
     
     try:
-        result = subprocess.run(cmd, check=False)
-        return result.returncode
+        if use_subprocess:
+            result = subprocess.run(cmd, check=False)
+            return result.returncode
+        
+        # Run in this interpreter to skip a second interpreter start-up
+        saved_argv = sys.argv
+        sys.argv = [str(demo_path)]
+        try:
+            runpy.run_path(str(demo_path), run_name="__main__")
+        except SystemExit as e:
+            return _exit_code(e.code)
+        finally:
+            sys.argv = saved_argv
+        return 0
     except KeyboardInterrupt:
         print(f"\nDemo '{demo_name}' interrupted by user")
         return 1
@@ -48,19 +79,24 @@ def run_demo(demo_name):
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python run_demo.py <demo_name>")
+    args = sys.argv[1:]
+    use_subprocess = "--subprocess" in args
+    if use_subprocess:
+        args.remove("--subprocess")
+    
+    if not args:
+        print("Usage: python run_demo.py [--subprocess] <demo_name>")
         print("\nAvailable demos:")
         demos = list_demos()
         for demo in demos:
             print(f"  - {demo}")
         return 1
     
-    demo_name = sys.argv[1]
+    demo_name = args[0]
     if not demo_name.endswith('.py'):
         demo_name += '.py'
     
-    return run_demo(demo_name)
+    return run_demo(demo_name, use_subprocess)
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -18,16 +18,24 @@ def main():
     # Change to project root directory
     os.chdir(project_root)
     
-    # Run pytest with the tests directory
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-v"]
+    # Run pytest with the tests directory; --subprocess runs it in a fresh
+    # interpreter for isolation instead of reusing this one
+    args = ["tests/", "-v"]
+    use_subprocess = "--subprocess" in sys.argv[1:]
     
     print("Running Orchestrator Platform tests...")
-    print(f"Command: {' '.join(cmd)}")
+    if use_subprocess:
+        cmd = [sys.executable, "-m", "pytest"] + args
+        print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
     
     try:
-        result = subprocess.run(cmd, check=False)
-        return result.returncode
+        if use_subprocess:
+            result = subprocess.run(cmd, check=False)
+            return result.returncode
+        
+        import pytest
+        return int(pytest.main(args))
     except KeyboardInterrupt:
         print("\nTests interrupted by user")
         return 1
@@ -11,10 +11,11 @@ Usage:
 Requirements covered: 5.1, 5.2, 5.3, 5.4
 """
 
+import gc
 import os
 import sys
-import time
 import signal
+import threading
 import argparse
 import logging
 from pathlib import Path
@@ -22,7 +23,14 @@ from pathlib import Path
 # Add hal_service to Python path
 sys.path.insert(0, str(Path(__file__).parent / "hal_service"))
 
-from hal_service.safety_monitor import SafetyMonitor
+try:
+    from hal_service.config import ConfigurationService
+    from hal_service.safety_monitor import SafetyMonitor
+except ImportError as e:
+    # Reported by check_dependencies() with install instructions
+    _import_error = e
+else:
+    _import_error = None
 
 
 def set_process_priority():
@@ -35,9 +43,14 @@ def set_process_priority():
         
         # Set high priority (requires appropriate permissions)
         if sys.platform == "linux":
-            # Set nice value to -10 (higher priority)
-            os.nice(-10)
-            print("Set process priority to high (nice -10)")
+            # Memory locking needs a different capability than renicing,
+            # so attempt it even if os.nice is refused
+            try:
+                # Set nice value to -10 (higher priority)
+                os.nice(-10)
+                print("Set process priority to high (nice -10)")
+            finally:
+                lock_process_memory()
         elif sys.platform == "win32":
             # Set high priority class on Windows
             process.nice(psutil.HIGH_PRIORITY_CLASS)
@@ -53,6 +66,24 @@ def set_process_priority():
         print(f"Failed to set process priority: {e}")
 
 
+def lock_process_memory():
+    """
+    Lock current and future pages in RAM so the safety loop never waits on a page fault.
+    
+    Linux only; needs CAP_IPC_LOCK or a large enough RLIMIT_MEMLOCK. SCHED_FIFO
+    priority and CPU pinning are applied to the safety threads themselves from
+    safety.realtime_priority and safety.cpu_affinity in the configuration.
+    """
+    import ctypes
+    
+    MCL_CURRENT, MCL_FUTURE = 1, 2
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.mlockall(MCL_CURRENT | MCL_FUTURE) == 0:
+        print("Locked process memory (mlockall)")
+    else:
+        print(f"Failed to lock process memory: {os.strerror(ctypes.get_errno())}")
+
+
 def setup_logging(log_level: str):
     """Set up logging for the safety monitor service."""
     # Create logs directory if it doesn't exist
@@ -76,39 +107,26 @@ def setup_logging(log_level: str):
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+# Set by the signal handler; main() blocks on it and then cleans up
+shutdown_event = threading.Event()
+
+
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     print(f"\nReceived signal {signum}, shutting down safety monitor service...")
-    if 'safety_monitor' in globals():
-        safety_monitor.stop()
-    sys.exit(0)
+    shutdown_event.set()
 
 
 def check_dependencies():
-    """Check that required dependencies are available."""
-    required_modules = [
-        "paho.mqtt.client",
-        "yaml", 
-        "pydantic"
-    ]
-    
-    missing_modules = []
-    
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
-    
-    if missing_modules:
-        print("ERROR: Missing required dependencies:")
-        for module in missing_modules:
-            print(f"  - {module}")
-        print("\nInstall missing dependencies with:")
-        print("  pip install paho-mqtt PyYAML pydantic")
-        return False
+    """Check that the service's imports (paho-mqtt, PyYAML, pydantic, ...) succeeded."""
+    if _import_error is None:
+        return True
     
-    return True
+    print("ERROR: Missing required dependency:")
+    print(f"  - {_import_error.name or _import_error}")
+    print("\nInstall missing dependencies with:")
+    print("  pip install paho-mqtt PyYAML pydantic")
+    return False
 
 
 def validate_config(config_path: str) -> bool:
@@ -127,9 +145,9 @@ def validate_config(config_path: str) -> bool:
         return False
     
     try:
-        with open(config_file, 'r') as f:
-            import yaml
-            yaml.safe_load(f)
+        # Load through ConfigurationService so the safety monitor's own load
+        # reuses the cached parse instead of parsing the YAML a second time
+        ConfigurationService(config_file).load_config()
         print(f"Configuration file validated: {config_path}")
         return True
     except Exception as e:
@@ -243,11 +261,17 @@ Examples:
             sys.exit(1)
         
         logger.info("Safety monitor started successfully")
+        
+        if args.priority == "high":
+            # Move startup objects out of GC tracking and collect less often,
+            # so per-scan allocations rarely trigger a collection pause
+            gc.freeze()
+            gc.set_threshold(50000, 10, 10)
+        
         print("Safety monitor service is running. Press Ctrl+C to stop.")
         
-        # Keep the main thread alive
-        while safety_monitor.running:
-            time.sleep(1.0)
+        # Block until a shutdown signal arrives; cleanup runs in finally
+        shutdown_event.wait()
             
     except KeyboardInterrupt:
         logger.info("Shutdown requested by user")
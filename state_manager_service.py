@@ -12,17 +12,12 @@ Usage:
 import argparse
 import signal
 import sys
-import time
+import threading
 from pathlib import Path
 
 # Add hal_service to path
 sys.path.insert(0, str(Path(__file__).parent / "hal_service"))
 
-from hal_service.state_manager import StateManager
-from hal_service.mqtt_client import MQTTConfig
-from hal_service.config import load_config
-from hal_service.logging_service import get_logging_service
-
 
 class StateManagerService:
     """Standalone State Manager Service"""
@@ -32,6 +27,8 @@ class StateManagerService:
         self.config_path = config_path
         self.state_manager = None
         self.running = False
+        self._shutdown_event = threading.Event()
+        self._received_signal = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -39,11 +36,20 @@ class StateManagerService:
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
-        print(f"\nReceived signal {signum}, shutting down gracefully...")
-        self.stop()
+        # Only record the signal and wake the main loop; main() stops the
+        # service afterwards. Printing here could re-enter a print() the
+        # main thread was interrupted in.
+        self._received_signal = signum
+        self._shutdown_event.set()
     
     def start(self):
         """Start the state manager service."""
+        # Imported here so --status doesn't pay for paho-mqtt, pydantic and numpy
+        from hal_service.state_manager import StateManager
+        from hal_service.mqtt_client import MQTTConfig
+        from hal_service.config import load_config
+        from hal_service.logging_service import get_logging_service
+        
         try:
             # Load configuration
             print("Loading configuration...")
@@ -57,14 +63,7 @@ class StateManagerService:
             logger.info("Starting State Manager Service")
             
             # Create MQTT configuration
-            mqtt_config = MQTTConfig(
-                broker_host=config.mqtt.broker_host,
-                broker_port=config.mqtt.broker_port,
-                keepalive=config.mqtt.keepalive,
-                client_id="state_manager_service",
-                username=getattr(config.mqtt, 'username', None),
-                password=getattr(config.mqtt, 'password', None)
-            )
+            mqtt_config = MQTTConfig.from_config(config.mqtt, "state_manager_service")
             
             # Get wheel base from configuration (default to 0.3m)
             wheel_base = 0.3  # Default wheel base
@@ -89,15 +88,18 @@ class StateManagerService:
             self.running = True
             logger.info("State Manager Service started successfully")
             
-            # Main service loop
+            # Main service loop: block until shutdown is requested, waking
+            # every few seconds to check the state manager is still alive
             try:
-                while self.running:
-                    time.sleep(1.0)
-                    
+                while not self._shutdown_event.wait(5.0):
                     # Check if state manager is still running
                     if not self.state_manager._running:
                         logger.error("State manager stopped unexpectedly")
                         break
+                
+                if self._received_signal is not None:
+                    print(f"\nReceived signal {self._received_signal}, shutting down gracefully...")
+                    logger.info("Received signal %s", self._received_signal)
                         
             except KeyboardInterrupt:
                 logger.info("Received keyboard interrupt")
@@ -113,6 +115,7 @@ class StateManagerService:
     def stop(self):
         """Stop the state manager service."""
         self.running = False
+        self._shutdown_event.set()
         
         if self.state_manager:
             print("Stopping state manager...")
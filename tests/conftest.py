@@ -3,8 +3,11 @@ Pytest configuration and shared fixtures for the test suite.
 """
 
 import pytest
+import yaml
 from unittest.mock import MagicMock
 
+from hal_service.config import ConfigurationService
+
 
 @pytest.fixture
 def mock_mqtt_client():
@@ -15,6 +18,18 @@ def mock_mqtt_client():
     return client
 
 
+@pytest.fixture
+def yaml_config():
+    """Factory that loads a configuration dict through YAML without touching disk.
+    
+    Returns a ``(service, config)`` tuple so tests can use the service's lookups.
+    """
+    def load(config_data):
+        service = ConfigurationService()
+        return service, service.load_config_from_string(yaml.dump(config_data))
+    return load
+
+
 @pytest.fixture
 def sample_config():
     """Sample configuration for testing."""
@@ -6,20 +6,20 @@ import pytest
 import sys
 import os
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Add hal_service to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'hal_service'))
+sys.path.insert(0, os.path.join(BASE_DIR, 'hal_service'))
 
 
 def test_project_structure():
     """Test that required project directories exist."""
-    base_dir = os.path.dirname(os.path.dirname(__file__))
-    
     required_dirs = ['hal_service', 'configs/node_red_config', 'docs', 'tests']
     
     for directory in required_dirs:
-        dir_path = os.path.join(base_dir, directory)
-        assert os.path.exists(dir_path), f"Directory {directory} should exist"
-        assert os.path.isdir(dir_path), f"{directory} should be a directory"
+        # isdir() is False for missing paths too, so one stat covers both checks
+        dir_path = os.path.join(BASE_DIR, directory)
+        assert os.path.isdir(dir_path), f"Directory {directory} should exist"
 
 
 def test_hal_service_import():
@@ -33,15 +33,11 @@ def test_hal_service_import():
 
 def test_requirements_file_exists():
     """Test that requirements.txt exists in hal_service."""
-    requirements_path = os.path.join(
-        os.path.dirname(__file__), '..', 'hal_service', 'requirements.txt'
-    )
+    requirements_path = os.path.join(BASE_DIR, 'hal_service', 'requirements.txt')
     assert os.path.exists(requirements_path), "requirements.txt should exist"
 
 
 def test_ci_config_exists():
     """Test that CI configuration exists."""
-    ci_path = os.path.join(
-        os.path.dirname(__file__), '..', '.github', 'workflows', 'ci.yml'
-    )
+    ci_path = os.path.join(BASE_DIR, '.github', 'workflows', 'ci.yml')
     assert os.path.exists(ci_path), "CI configuration should exist"
\ No newline at end of file
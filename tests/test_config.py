@@ -7,6 +7,7 @@ functionality of the HAL configuration service.
 
 import pytest
 import tempfile
+from unittest.mock import patch
 import yaml
 from pathlib import Path
 from pydantic import ValidationError
@@ -19,8 +20,11 @@ from hal_service.config import (
     GPIOConfig,
     I2CConfig,
     UARTConfig,
+    SafetyConfig,
+    MQTTConfig,
     get_config_service,
-    load_config
+    load_config,
+    clear_cache
 )
 
 
@@ -33,27 +37,12 @@ class TestConfigurationModels:
         assert config.pin == 18
         assert config.mode == "OUT"
     
-    def test_gpio_config_invalid_pin(self):
-        """Test invalid GPIO pin number."""
-        with pytest.raises(ValidationError):
-            GPIOConfig(pin=50, mode="OUT")  # Pin > 40
-    
-    def test_gpio_config_invalid_mode(self):
-        """Test invalid GPIO mode."""
-        with pytest.raises(ValidationError):
-            GPIOConfig(pin=18, mode="INVALID")
-    
     def test_i2c_config_valid(self):
         """Test valid I2C configuration."""
         config = I2CConfig(address="0x48", bus=1)
         assert config.address == "0x48"
         assert config.bus == 1
     
-    def test_i2c_config_invalid_address(self):
-        """Test invalid I2C address format."""
-        with pytest.raises(ValidationError):
-            I2CConfig(address="48", bus=1)  # Missing 0x prefix
-    
     def test_uart_config_valid(self):
         """Test valid UART configuration."""
         config = UARTConfig(port="/dev/ttyUSB0", baudrate=115200)
@@ -73,17 +62,6 @@ class TestConfigurationModels:
         assert config.type == "dc"
         assert config.gpio_pins["enable"] == 18
     
-    def test_motor_config_missing_gpio_pins(self):
-        """Test motor config with missing required GPIO pins."""
-        with pytest.raises(ValidationError):
-            MotorConfig(
-                name="test_motor",
-                type="dc",
-                gpio_pins={"enable": 18},  # Missing direction pin
-                max_speed=1.0,
-                acceleration=0.5
-            )
-    
     def test_sensor_config_valid(self):
         """Test valid sensor configuration."""
         interface = GPIOConfig(pin=20, mode="IN")
@@ -96,6 +74,40 @@ class TestConfigurationModels:
         assert config.name == "test_sensor"
         assert config.type == "encoder"
         assert config.publish_rate == 10.0
+    
+    def test_safety_zone_config_defaults(self):
+        """Test safety zones are parsed into typed models with defaults."""
+        config = SafetyConfig(safety_zones=[{"name": "custom_zone", "max_angle": 90.0}])
+        zone = config.safety_zones[0]
+        assert zone.name == "custom_zone"
+        assert zone.min_angle == 0.0
+        assert zone.max_angle == 90.0
+        assert zone.action == "warn"
+    
+    @pytest.mark.parametrize("model_cls, kwargs", [
+        pytest.param(GPIOConfig, {"pin": 50, "mode": "OUT"}, id="gpio-pin-above-40"),
+        pytest.param(GPIOConfig, {"pin": 18, "mode": "INVALID"}, id="gpio-invalid-mode"),
+        pytest.param(I2CConfig, {"address": "48", "bus": 1}, id="i2c-address-missing-0x"),
+        pytest.param(MotorConfig, {
+            "name": "test_motor",
+            "type": "dc",
+            "gpio_pins": {"enable": 18},
+            "max_speed": 1.0,
+            "acceleration": 0.5
+        }, id="motor-missing-direction-pin"),
+        pytest.param(SafetyConfig, {"safety_zones": [{"action": "explode"}]}, id="safety-zone-invalid-action"),
+    ])
+    def test_model_rejects_invalid(self, model_cls, kwargs):
+        """Test invalid model fields are rejected."""
+        with pytest.raises(ValidationError):
+            model_cls(**kwargs)
+    
+    def test_mqtt_codec(self):
+        """Test the MQTT wire codec defaults to JSON and rejects unknown formats."""
+        assert MQTTConfig().codec == "json"
+        assert MQTTConfig(codec="msgpack").codec == "msgpack"
+        with pytest.raises(ValidationError):
+            MQTTConfig(codec="xml")
 
 
 class TestConfigurationService:
@@ -143,27 +155,72 @@ class TestConfigurationService:
             ]
         }
     
-    def test_load_config_from_file(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_config_path(cls, tmp_path_factory):
+        """Write the test configuration once for the tests that only read it."""
+        config_path = tmp_path_factory.mktemp("config") / "config.yaml"
+        config_path.write_text(yaml.dump(cls().create_test_config()))
+        return config_path
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config_service(cls, sample_config_path):
+        """Loaded service shared by tests that only query it."""
+        service = ConfigurationService(sample_config_path)
+        service.load_config()
+        return service
+    
+    def test_load_config_from_file(self, sample_config_path):
         """Test loading configuration from a YAML file."""
+        service = ConfigurationService(sample_config_path)
+        config = service.load_config()
+        
+        assert isinstance(config, OrchestratorConfig)
+        assert config.system.logging.level == "DEBUG"
+        assert config.mqtt.broker_host == "localhost"
+        assert len(config.motors) == 1
+        assert config.motors[0].name == "test_motor"
+        assert len(config.sensors) == 1
+        assert config.sensors[0].name == "test_sensor"
+    
+    def test_load_config_reuses_cached_parse(self, tmp_path, monkeypatch):
+        """Test an unchanged file is loaded from the parse cache and a changed one is re-parsed."""
         config_data = self.create_test_config()
+        config_data["mqtt"]["broker_host"] = "${TEST_MQTT_HOST:localhost}"
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_data))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        ConfigurationService(config_path).load_config()
+        assert (tmp_path / "config.yaml.cache").exists()
         
-        try:
-            service = ConfigurationService(config_path)
-            config = service.load_config()
-            
-            assert isinstance(config, OrchestratorConfig)
-            assert config.system.logging.level == "DEBUG"
-            assert config.mqtt.broker_host == "localhost"
-            assert len(config.motors) == 1
-            assert config.motors[0].name == "test_motor"
-            assert len(config.sensors) == 1
-            assert config.sensors[0].name == "test_sensor"
-        finally:
-            Path(config_path).unlink()
+        # Cache hit: no YAML parse, environment variables still substituted per load
+        clear_cache()
+        monkeypatch.setenv("TEST_MQTT_HOST", "broker.local")
+        with patch("hal_service.config.yaml.load", side_effect=AssertionError("parsed")):
+            config = ConfigurationService(config_path).load_config()
+        assert config.mqtt.broker_host == "broker.local"
+        
+        # Source changed: cache is ignored
+        config_data["system"]["logging"]["level"] = "INFO"
+        config_path.write_text(yaml.dump(config_data))
+        config = ConfigurationService(config_path).load_config()
+        assert config.system.logging.level == "INFO"
+    
+    def test_load_config_reuses_parse_in_process(self, tmp_path):
+        """Test an unchanged file is not read again within the same process."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(self.create_test_config()))
+        
+        ConfigurationService(config_path).load_config()
+        with patch.object(ConfigurationService, "_read_config_file", side_effect=AssertionError("read")):
+            config = ConfigurationService(config_path).load_config()
+        assert config.motors[0].name == "test_motor"
+        
+        clear_cache()
+        with pytest.raises(AssertionError):
+            with patch.object(ConfigurationService, "_read_config_file", side_effect=AssertionError("read")):
+                ConfigurationService(config_path).load_config()
     
     def test_load_config_file_not_found(self):
         """Test loading config when file doesn't exist."""
@@ -179,6 +236,7 @@ class TestConfigurationService:
             config_path = f.name
         
         try:
+            clear_cache()
             service = ConfigurationService(config_path)
             with pytest.raises(yaml.YAMLError):
                 service.load_config()
@@ -210,66 +268,33 @@ class TestConfigurationService:
         finally:
             Path(config_path).unlink()
     
-    def test_get_motor_config(self):
+    def test_get_motor_config(self, config_service):
         """Test retrieving specific motor configuration."""
-        config_data = self.create_test_config()
+        motor_config = config_service.get_motor_config("test_motor")
+        assert motor_config is not None
+        assert motor_config.name == "test_motor"
+        assert motor_config.type == "dc"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            service = ConfigurationService(config_path)
-            service.load_config()
-            
-            motor_config = service.get_motor_config("test_motor")
-            assert motor_config is not None
-            assert motor_config.name == "test_motor"
-            assert motor_config.type == "dc"
-            
-            # Test non-existent motor
-            missing_motor = service.get_motor_config("nonexistent")
-            assert missing_motor is None
-        finally:
-            Path(config_path).unlink()
+        # Test non-existent motor
+        missing_motor = config_service.get_motor_config("nonexistent")
+        assert missing_motor is None
     
-    def test_get_sensor_config(self):
+    def test_get_sensor_config(self, config_service):
         """Test retrieving specific sensor configuration."""
-        config_data = self.create_test_config()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        sensor_config = config_service.get_sensor_config("test_sensor")
+        assert sensor_config is not None
+        assert sensor_config.name == "test_sensor"
+        assert sensor_config.type == "encoder"
         
-        try:
-            service = ConfigurationService(config_path)
-            service.load_config()
-            
-            sensor_config = service.get_sensor_config("test_sensor")
-            assert sensor_config is not None
-            assert sensor_config.name == "test_sensor"
-            assert sensor_config.type == "encoder"
-            
-            # Test non-existent sensor
-            missing_sensor = service.get_sensor_config("nonexistent")
-            assert missing_sensor is None
-        finally:
-            Path(config_path).unlink()
+        # Test non-existent sensor
+        missing_sensor = config_service.get_sensor_config("nonexistent")
+        assert missing_sensor is None
     
-    def test_validate_config_file(self):
+    def test_validate_config_file(self, sample_config_path):
         """Test configuration file validation."""
-        config_data = self.create_test_config()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            service = ConfigurationService()
-            is_valid = service.validate_config_file(config_path)
-            assert is_valid is True
-        finally:
-            Path(config_path).unlink()
+        service = ConfigurationService()
+        is_valid = service.validate_config_file(sample_config_path)
+        assert is_valid is True
     
     def test_create_default_config(self):
         """Test creating a default configuration file."""
@@ -286,13 +311,13 @@ class TestConfigurationService:
             service = ConfigurationService(config_path)
             config = service.load_config()
             assert isinstance(config, OrchestratorConfig)
+            assert [motor.name for motor in config.motors] == ["left_motor", "right_motor"]
+            assert [sensor.name for sensor in config.sensors] == ["lidar_01", "left_encoder"]
+            assert config.mqtt.broker_host == "localhost"
     
-    def test_environment_variable_substitution(self):
+    def test_environment_variable_substitution(self, yaml_config, monkeypatch):
         """Test environment variable substitution in config."""
-        import os
-        
-        # Set test environment variable
-        os.environ["TEST_MQTT_HOST"] = "test.example.com"
+        monkeypatch.setenv("TEST_MQTT_HOST", "test.example.com")
         
         config_data = {
             "mqtt": {
@@ -301,21 +326,10 @@ class TestConfigurationService:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            service = ConfigurationService(config_path)
-            config = service.load_config()
-            
-            assert config.mqtt.broker_host == "test.example.com"
-        finally:
-            Path(config_path).unlink()
-            # Clean up environment variable
-            del os.environ["TEST_MQTT_HOST"]
+        _, config = yaml_config(config_data)
+        assert config.mqtt.broker_host == "test.example.com"
     
-    def test_environment_variable_with_default(self):
+    def test_environment_variable_with_default(self, yaml_config):
         """Test environment variable substitution with default value."""
         config_data = {
             "mqtt": {
@@ -324,17 +338,8 @@ class TestConfigurationService:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            service = ConfigurationService(config_path)
-            config = service.load_config()
-            
-            assert config.mqtt.broker_host == "default.example.com"
-        finally:
-            Path(config_path).unlink()
+        _, config = yaml_config(config_data)
+        assert config.mqtt.broker_host == "default.example.com"
 
 
 class TestGlobalConfigService:
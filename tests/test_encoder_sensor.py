@@ -198,6 +198,26 @@ class TestEncoderSensor:
         assert encoder_sensor.last_a_state == 1
         assert encoder_sensor.last_b_state == 1
     
+    @patch('hal_service.encoder_sensor.GPIO')
+    def test_quadrature_cycle_counts_each_edge_once(self, mock_gpio, encoder_sensor):
+        """Test a full forward cycle counts four ticks whichever handler sees each edge."""
+        encoder_sensor._initialized = True
+        encoder_sensor.last_a_state = 0
+        encoder_sensor.last_b_state = 0
+        
+        pins = {20: 0, 21: 0}
+        mock_gpio.input.side_effect = lambda pin: pins[pin]
+        
+        # Forward Gray sequence 00 -> 10 -> 11 -> 01 -> 00
+        for a, b in [(1, 0), (1, 1), (0, 1), (0, 0)]:
+            pins[20], pins[21] = a, b
+            # Both handlers run for every edge; the second one sees no change
+            encoder_sensor._encoder_interrupt_a(20)
+            encoder_sensor._encoder_interrupt_b(21)
+        
+        assert encoder_sensor.tick_count == 4
+        assert encoder_sensor.direction == 1
+    
     def test_velocity_calculation(self, encoder_sensor):
         """Test velocity calculation with simulated ticks."""
         encoder_sensor._initialized = True
@@ -217,6 +237,17 @@ class TestEncoderSensor:
         assert encoder_sensor.velocity > 0
         assert encoder_sensor.total_distance > 0
     
+    def test_velocity_window_drops_old_ticks(self, encoder_sensor):
+        """Test ticks older than the velocity window are discarded."""
+        start_time = time.time()
+        
+        for i in range(5):
+            encoder_sensor.tick_count = i * 10
+            encoder_sensor._update_velocity(start_time + i * 0.04)
+        
+        # Window is 0.1s: only the ticks at 0.08, 0.12 and 0.16 remain
+        assert [count for _, count in encoder_sensor.recent_ticks] == [20, 30, 40]
+    
     def test_reset_encoder(self, encoder_sensor):
         """Test encoder reset functionality."""
         # Set some values
@@ -334,6 +365,16 @@ class TestEncoderSensor:
         # Should be 60 RPM (1 rev/sec * 60 sec/min)
         assert abs(data["rpm"] - 60.0) < 0.1
     
+    def test_calibration_change_updates_distance(self, encoder_sensor):
+        """Test changing calibration after construction is reflected in readings."""
+        encoder_sensor.gear_ratio = 2.0
+        encoder_sensor.tick_count = 1000
+        encoder_sensor._update_velocity(time.time())
+        
+        # Half a wheel revolution at 2:1 gearing
+        assert abs(encoder_sensor.total_distance - 3.14159 * 0.1 / 2) < 1e-9
+        assert abs(encoder_sensor.read_data()["distance_per_tick"] - 3.14159 * 0.1 / 2000) < 1e-12
+    
     @patch('hal_service.encoder_sensor.GPIO')
     def test_single_channel_encoder(self, mock_gpio, mock_mqtt_client):
         """Test single-channel encoder configuration."""
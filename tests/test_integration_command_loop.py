@@ -174,6 +174,43 @@ class TestMQTTCommunicationReliability:
         assert len(data_messages) > 0  # Should match orchestrator/data/+
         assert len(status_messages) == 0  # Should not match either pattern
     
+    def test_multi_level_wildcard_and_unsubscribe(self):
+        """Test '#' filters and that unsubscribed filters stop receiving."""
+        self.mqtt_client.connect()
+        
+        self.mqtt_client.subscribe_with_callback("orchestrator/data/#", self.message_callback)
+        self.mqtt_client.subscribe_with_callback("orchestrator/+/lidar/raw", self.message_callback)
+        
+        self.mqtt_client.publish("orchestrator/data", {"n": 1})            # '#' includes the parent level
+        self.mqtt_client.publish("orchestrator/data/lidar/raw", {"n": 2})  # both filters
+        self.mqtt_client.publish("orchestrator/cmd/lidar/raw", {"n": 3})   # '+' filter only
+        self.mqtt_client.publish("orchestrator/cmd/lidar", {"n": 4})       # neither
+        
+        assert sorted(msg["payload"]["n"] for msg in self.received_messages) == [1, 2, 2, 3]
+        
+        self.received_messages.clear()
+        self.mqtt_client.unsubscribe("orchestrator/data/#")
+        self.mqtt_client.publish("orchestrator/data/lidar/raw", {"n": 5})
+        
+        assert [msg["payload"]["n"] for msg in self.received_messages] == [5]
+        
+        # Retained messages and history filters follow the same matching rules
+        self.mqtt_client.unsubscribe("orchestrator/+/lidar/raw")
+        self.mqtt_client.get_mock_client().clear_history()
+        self.mqtt_client.publish("orchestrator/data", {"n": 6}, retain=True)
+        self.mqtt_client.publish("orchestrator/data/lidar/raw", {"n": 7}, retain=True)
+        self.mqtt_client.publish("orchestrator/cmd/lidar/raw", {"n": 8}, retain=True)
+        self.mqtt_client.publish("orchestrator/cmd/lidar", {"n": 9}, retain=True)
+        
+        history = self.mqtt_client.get_mock_client().get_message_history("orchestrator/+/#")
+        assert len(history) == 4
+        
+        self.received_messages.clear()
+        self.mqtt_client.subscribe_with_callback("orchestrator/data/#", self.message_callback)
+        self.mqtt_client.subscribe_with_callback("orchestrator/+/lidar/raw", self.message_callback)
+        
+        assert sorted(msg["payload"]["n"] for msg in self.received_messages) == [6, 7, 7, 8]
+    
     def test_json_serialization_deserialization(self):
         """Test JSON serialization and deserialization."""
         self.mqtt_client.connect()
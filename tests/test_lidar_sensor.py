@@ -433,6 +433,39 @@ class TestLidarSensor:
         
         assert topic == "orchestrator/data/lidar_01"
     
+    def test_publish_binary_scan_with_msgpack_codec(self, mock_mqtt_client, sensor_config):
+        """Test ranges/angles are packed as float32 when the MQTT codec is msgpack."""
+        from hal_service.safety_monitor import _as_scan_array
+        
+        mock_mqtt_client.codec = "msgpack"
+        sensor = LidarSensor("lidar_01", mock_mqtt_client, sensor_config)
+        
+        sensor.publish_data({"scan_available": True, "ranges": [1.0, 2.5], "angles": [0.0, 90.0]})
+        
+        message = mock_mqtt_client.publish.call_args[0][1]
+        assert isinstance(message["data"]["ranges"], bytes)
+        assert _as_scan_array(message["data"]["ranges"]).tolist() == [1.0, 2.5]
+        assert _as_scan_array(message["data"]["angles"]).tolist() == [0.0, 90.0]
+    
+    def test_msgpack_config_through_mock_client_publishes_lists(self, sensor_config):
+        """Test the mock client, which always sends JSON, gets plain lists even with codec msgpack."""
+        from hal_service.config import MQTTConfig
+        from hal_service.mock.mock_mqtt_client import MockMQTTClientWrapper
+        from hal_service.safety_monitor import _as_scan_array
+        
+        client = MockMQTTClientWrapper(MQTTConfig(client_id="mock_lidar", codec="msgpack"))
+        client.connect()
+        received = []
+        client.subscribe_with_callback("orchestrator/data/lidar_01", received.append)
+        
+        sensor = LidarSensor("lidar_01", client, sensor_config)
+        sensor.publish_data({"scan_available": True, "ranges": [1.0, 2.5], "angles": [0.0, 90.0]})
+        
+        data = received[-1]["payload"]["data"]
+        assert data["ranges"] == [1.0, 2.5]
+        assert _as_scan_array(data["ranges"]).tolist() == [1.0, 2.5]
+        assert _as_scan_array(data["angles"]).tolist() == [0.0, 90.0]
+    
     def test_scan_loop_error_handling(self, lidar_sensor):
         """Test error handling in scan loop."""
         # Mock a scan method that raises an exception
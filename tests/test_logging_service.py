@@ -132,6 +132,22 @@ class TestStructuredLogger:
         assert "extra_field" in kwargs["extra"]
         assert kwargs["extra"]["component"] == "hal_service"
     
+    def test_deferred_formatting_args(self):
+        """Test %-style arguments are passed through unformatted."""
+        self.structured_logger.warning("Obstacle at %.2fm", 0.25)
+        
+        args, kwargs = self.mock_logger.log.call_args
+        assert args == (logging.WARNING, "Obstacle at %.2fm", 0.25)
+    
+    def test_disabled_level_skips_logging(self):
+        """Test messages below the enabled level are dropped early."""
+        self.mock_logger.isEnabledFor.return_value = False
+        
+        self.structured_logger.debug("Not emitted")
+        
+        assert not self.structured_logger.isEnabledFor(logging.DEBUG)
+        self.mock_logger.log.assert_not_called()
+    
     def test_context_management(self):
         """Test context field management."""
         # Set persistent context
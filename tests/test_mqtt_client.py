@@ -58,6 +58,17 @@ class TestTopicValidator:
             assert TopicValidator.validate_topic(topic), f"Topic should be valid: {topic}"
             assert TopicValidator.get_topic_type(topic) == "status"
     
+    def test_valid_ack_topics(self):
+        """Test validation of acknowledgment topics"""
+        valid_topics = [
+            "orchestrator/ack/estop",
+            "orchestrator/ack/left_motor"
+        ]
+        
+        for topic in valid_topics:
+            assert TopicValidator.validate_topic(topic), f"Topic should be valid: {topic}"
+            assert TopicValidator.get_topic_type(topic) == "ack"
+    
     def test_invalid_topics(self):
         """Test rejection of invalid topics"""
         invalid_topics = [
@@ -279,6 +290,88 @@ class TestMQTTClientWrapper:
         assert status['broker_port'] == 1883
         assert status['client_id'] == "test_client"
     
+    def test_msgpack_codec_round_trip(self):
+        """Test publish/receive with the optional msgpack codec"""
+        msgpack = pytest.importorskip("msgpack")
+        client = MQTTClientWrapper(MQTTConfig(client_id="test_client", codec="msgpack"))
+        client._connected = True
+        client._client = Mock()
+        client._client.publish.return_value = Mock(rc=0)
+        
+        assert client.publish("orchestrator/data/lidar", {"ranges": [1.0, 2.5]})
+        encoded = client._client.publish.call_args[0][1]
+        assert msgpack.unpackb(encoded, raw=False)["ranges"] == [1.0, 2.5]
+        
+        callback = Mock()
+        client._message_callbacks["orchestrator/data/+"] = callback
+        mock_msg = Mock(topic="orchestrator/data/lidar", payload=encoded, qos=0, retain=False)
+        client._on_message(None, None, mock_msg)
+        
+        assert callback.call_args[0][0]['payload']['ranges'] == [1.0, 2.5]
+    
+    def test_publish_pre_encoded_bytes(self, mqtt_client):
+        """Test that bytes payloads are published without re-encoding"""
+        mqtt_client._connected = True
+        mqtt_client._client = Mock()
+        mqtt_client._client.publish.return_value = Mock(rc=0)
+        
+        raw = b'{"status":"ok"}'
+        assert mqtt_client.publish("orchestrator/status/robot", raw, qos=1)
+        
+        mqtt_client._client.publish.assert_called_once_with(
+            "orchestrator/status/robot", raw, qos=1, retain=False
+        )
+    
+    def test_publish_json_string(self, mqtt_client):
+        """Test that JSON text is sent as-is instead of being encoded twice"""
+        mqtt_client._connected = True
+        mqtt_client._client = Mock()
+        mqtt_client._client.publish.return_value = Mock(rc=0)
+        
+        assert mqtt_client.publish("orchestrator/data/encoder", '{"data": {"ticks": 3}}')
+        
+        encoded = mqtt_client._client.publish.call_args[0][1]
+        assert json.loads(encoded) == {"data": {"ticks": 3}}
+    
+    def test_publish_json_string_with_msgpack_codec(self):
+        """Test that JSON text is re-encoded when the msgpack codec is active"""
+        msgpack = pytest.importorskip("msgpack")
+        client = MQTTClientWrapper(MQTTConfig(client_id="test_client", codec="msgpack"))
+        client._connected = True
+        client._client = Mock()
+        client._client.publish.return_value = Mock(rc=0)
+        
+        assert client.publish("orchestrator/data/encoder", '{"data": {"ticks": 3}}')
+        
+        encoded = client._client.publish.call_args[0][1]
+        assert msgpack.unpackb(encoded, raw=False) == {"data": {"ticks": 3}}
+    
+    def test_inflight_window_configured(self):
+        """Test the inflight and queue limits are applied to the paho client"""
+        client = MQTTClientWrapper(MQTTConfig(client_id="test_client", max_inflight=50, max_queued=100))
+        
+        assert client._client._max_inflight_messages == 50
+        assert client._client._max_queued_messages == 100
+    
+    def test_config_from_orchestrator_section(self):
+        """Test client settings are built from the orchestrator's mqtt section"""
+        from hal_service.config import MQTTConfig as MQTTSection
+        
+        section = MQTTSection(broker_host="broker.local", username="robot", codec="msgpack", max_queued=10)
+        config = MQTTConfig.from_config(section, "test_client")
+        
+        assert config.broker_host == "broker.local"
+        assert config.client_id == "test_client"
+        assert config.username == "robot"
+        assert config.password is None
+        assert config.codec == "msgpack"
+        assert config.max_queued == 10
+    
+    def test_unsupported_codec(self):
+        """Test that an unknown codec is rejected at construction"""
+        with pytest.raises(ValueError):
+            MQTTClientWrapper(MQTTConfig(client_id="test_client", codec="xml"))
+    
     @patch('paho.mqtt.client.Client')
     def test_disconnect(self, mock_mqtt_client, mqtt_client):
         """Test client disconnection"""
@@ -7,6 +7,7 @@ without requiring actual hardware or MQTT broker.
 """
 
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -65,6 +66,45 @@ def test_graceful_shutdown(orchestrator):
         return False
 
 
+def test_run_exits_on_shutdown():
+    """Test the main loop wakes as soon as shutdown is requested."""
+    print("\nTesting run loop shutdown latency...")
+    
+    orchestrator = orchestrator_hal.HALOrchestrator(config_path='config.yaml', test_mode=True)
+    assert orchestrator._load_configuration(), "Configuration loading failed"
+    
+    threading.Timer(0.1, orchestrator.shutdown_event.set).start()
+    start = time.monotonic()
+    orchestrator.run()
+    elapsed = time.monotonic() - start
+    
+    assert elapsed < 0.5, f"Main loop took {elapsed:.3f}s to exit"
+    print(f"✓ Main loop exited {elapsed:.3f}s after start")
+
+
+def test_devices_initialized_concurrently():
+    """Test device init overlaps and keeps configuration order."""
+    orchestrator = orchestrator_hal.HALOrchestrator(config_path='config.yaml')
+    assert orchestrator._load_configuration(), "Configuration loading failed"
+    
+    def slow_init(device_config):
+        time.sleep(0.2)
+        with orchestrator._devices_lock:
+            orchestrator.devices[device_config.name] = object()
+        return True
+    
+    orchestrator._initialize_motor = slow_init
+    orchestrator._initialize_sensor = slow_init
+    
+    start = time.monotonic()
+    assert orchestrator._initialize_devices()
+    elapsed = time.monotonic() - start
+    
+    expected = [m.name for m in orchestrator.config.motors] + [s.name for s in orchestrator.config.sensors]
+    assert list(orchestrator.devices) == expected
+    assert elapsed < 0.2 * len(expected)
+
+
 def main():
     """Run all tests."""
     print("HAL Orchestrator Service Test Suite")
@@ -83,6 +123,13 @@ def main():
     if not test_graceful_shutdown(orchestrator):
         return False
     
+    # Test run loop shutdown latency
+    try:
+        test_run_exits_on_shutdown()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        return False
+    
     print("\n" + "=" * 40)
     print("✓ All tests passed successfully!")
     return True
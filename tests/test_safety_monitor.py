@@ -10,14 +10,19 @@ import time
 import threading
 import unittest
 from unittest.mock import Mock, MagicMock, patch
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "hal_service"))
 
-from hal_service.safety_monitor import SafetyMonitor, SafetyZone, ObstacleDetection
-from hal_service.config import OrchestratorConfig, SafetyConfig, MQTTConfig
+from hal_service.safety_monitor import (
+    SafetyMonitor, SafetyZone, ObstacleDetection, DetectionHistory,
+    _parse_lidar_timestamp, _scan_all_zones, _zone_angle_masks
+)
+from hal_service.config import OrchestratorConfig, SafetyConfig, SafetyZoneConfig, MQTTConfig
 
 
 class TestSafetyMonitor(unittest.TestCase):
@@ -31,11 +36,19 @@ class TestSafetyMonitor(unittest.TestCase):
         self.mock_config.safety.enabled = True
         self.mock_config.safety.obstacle_threshold = 0.5
         self.mock_config.safety.emergency_stop_timeout = 0.1
+        self.mock_config.safety.safety_zones = []
+        self.mock_config.safety.realtime_priority = None
+        self.mock_config.safety.cpu_affinity = None
         
         self.mock_config.mqtt = Mock(spec=MQTTConfig)
         self.mock_config.mqtt.broker_host = "localhost"
         self.mock_config.mqtt.broker_port = 1883
         self.mock_config.mqtt.keepalive = 60
+        self.mock_config.mqtt.username = None
+        self.mock_config.mqtt.password = None
+        self.mock_config.mqtt.codec = "json"
+        self.mock_config.mqtt.max_inflight = 20
+        self.mock_config.mqtt.max_queued = 0
         
         # Mock MQTT client
         self.mock_mqtt_client = Mock()
@@ -161,6 +174,48 @@ class TestSafetyMonitor(unittest.TestCase):
         
         self.assertIsNotNone(estop_call)
     
+    def test_estop_published_before_warning_report(self):
+        """Test the e-stop goes out before warning zones are reported."""
+        monitor = SafetyMonitor()
+        events = []
+        self.mock_mqtt_client.publish.side_effect = lambda topic, *a, **kw: events.append(topic) or True
+        self.mock_logger.warning.side_effect = lambda *a, **kw: events.append("warning")
+        self.mock_logger.error.side_effect = lambda *a, **kw: events.append("critical_log")
+        
+        ranges = [2.0] * 72
+        ranges[0] = 0.3   # critical front
+        ranges[18] = 0.3  # warning left
+        
+        monitor._process_lidar_data({
+            "timestamp": datetime.now().isoformat(),
+            "ranges": ranges,
+            "angles": list(range(0, 360, 5))
+        })
+        
+        self.assertEqual(events[0], "orchestrator/cmd/estop")
+        self.assertLess(events.index("orchestrator/cmd/estop"), events.index("critical_log"))
+        self.assertIn("warning", events)
+        self.assertEqual(len(monitor.obstacle_detections), 2)
+        rows = monitor.obstacle_detections.recent_rows(2)
+        self.assertEqual(monitor.obstacle_detections.critical[rows].tolist(), [True, False])
+    
+    def test_lidar_data_processing_binary_arrays(self):
+        """Test packed float32 ranges/angles are processed like lists."""
+        monitor = SafetyMonitor()
+        
+        ranges = np.full(72, 2.0, dtype='<f4')
+        ranges[0] = 0.25
+        angles = np.arange(0, 360, 5, dtype='<f4')
+        
+        monitor._process_lidar_data({
+            "timestamp": datetime.now().isoformat(),
+            "ranges": ranges.tobytes(),
+            "angles": angles.tobytes()
+        })
+        
+        self.assertTrue(monitor.emergency_stop_active)
+        self.assertEqual(monitor.emergency_stops_triggered, 1)
+    
     def test_lidar_data_processing_with_warning_obstacle(self):
         """Test processing LiDAR data with warning-level obstacle."""
         monitor = SafetyMonitor()
@@ -184,33 +239,77 @@ class TestSafetyMonitor(unittest.TestCase):
         # Should have logged warning
         self.mock_logger.warning.assert_called()
     
-    def test_check_zone_for_obstacles(self):
-        """Test obstacle detection within specific zones."""
+    def test_configured_safety_zones(self):
+        """Test zones from SafetyConfig are appended after the defaults."""
+        self.mock_config.safety.safety_zones = [
+            SafetyZoneConfig(name="rear", min_angle=160.0, max_angle=200.0, action="stop")
+        ]
         monitor = SafetyMonitor()
         
-        # Create test zone
-        test_zone = SafetyZone(
-            name="test_zone",
-            min_angle=350.0,  # Zone crossing 0 degrees
-            max_angle=10.0,
-            min_distance=1.0,
-            priority=1,
-            action="stop"
-        )
-        
+        rear = monitor.safety_zones[-1]
+        self.assertEqual(rear.name, "rear")
+        self.assertEqual(rear.min_distance, 0.5)
+        self.assertEqual(rear.priority, 3)
+        self.assertTrue(monitor._zone_is_stop[-1])
+    
+    def test_check_zone_for_obstacles(self):
+        """Test obstacle detection within a zone crossing 0 degrees."""
         # Test data with obstacles in and out of zone
-        ranges = [0.5, 2.0, 0.8, 2.0, 0.6]  # Some close, some far
-        angles = [355.0, 45.0, 5.0, 180.0, 2.0]  # Some in zone, some out
+        ranges = np.array([0.5, 2.0, 0.8, 2.0, 0.6])  # Some close, some far
+        angles = np.array([355.0, 45.0, 5.0, 180.0, 2.0])  # Some in zone, some out
         
-        obstacles = monitor._check_zone_for_obstacles(test_zone, ranges, angles)
+        zone_masks = _zone_angle_masks(angles, np.array([350.0]), np.array([10.0]))
+        zone_indices, point_indices = _scan_all_zones(ranges, zone_masks, np.array([1.0]))
+        obstacles = list(zip(ranges[point_indices].tolist(), angles[point_indices].tolist()))
         
         # Should detect obstacles at 355°, 5°, and 2° (all within zone and distance)
         expected_obstacles = [(0.5, 355.0), (0.8, 5.0), (0.6, 2.0)]
         self.assertEqual(len(obstacles), 3)
+        self.assertTrue(np.all(zone_indices == 0))
         
         for expected in expected_obstacles:
             self.assertIn(expected, obstacles)
     
+    def test_scan_all_zones_matches_per_zone_check(self):
+        """Test the fused zone scan agrees with checking each zone on its own."""
+        monitor = SafetyMonitor()
+        monitor.safety_zones.append(SafetyZone(
+            name="wrap_zone", min_angle=350.0, max_angle=10.0,
+            min_distance=1.0, priority=3, action="warn"
+        ))
+        monitor._pack_safety_zones()
+        
+        ranges = np.array([0.3, 0.05, 0.4, 2.0, 0.2, 0.3, 0.9])
+        angles = np.array([0.0, 10.0, 90.0, 100.0, 270.0, -5.0, 355.0])
+        normalized = np.mod(angles, 360.0)
+        zone_masks = _zone_angle_masks(
+            normalized, monitor._zone_min_angle, monitor._zone_max_angle
+        )
+        
+        zone_indices, point_indices = _scan_all_zones(
+            ranges, zone_masks, monitor._zone_min_distance
+        )
+        
+        for z, zone in enumerate(monitor.safety_zones):
+            if zone.min_angle <= zone.max_angle:
+                in_zone = (normalized >= zone.min_angle) & (normalized <= zone.max_angle)
+            else:
+                in_zone = (normalized >= zone.min_angle) | (normalized <= zone.max_angle)
+            expected = ranges[in_zone & (ranges >= 0.1) & (ranges <= zone.min_distance)]
+            np.testing.assert_array_equal(ranges[point_indices[zone_indices == z]], expected)
+    
+    def test_zone_beam_masks_cached_per_angle_grid(self):
+        """Test beam masks are reused for a fixed grid and rebuilt when it changes."""
+        monitor = SafetyMonitor()
+        grid = np.arange(0.0, 360.0, 5.0)
+        
+        masks = monitor._get_zone_beam_masks(grid)
+        self.assertIs(monitor._get_zone_beam_masks(grid.copy()), masks)
+        
+        shifted = monitor._get_zone_beam_masks(grid + 1.0)
+        self.assertIsNot(shifted, masks)
+        self.assertEqual(shifted.shape, (len(monitor.safety_zones), len(grid)))
+    
     def test_handle_lidar_data_message(self):
         """Test handling MQTT LiDAR data messages."""
         monitor = SafetyMonitor()
@@ -236,6 +335,28 @@ class TestSafetyMonitor(unittest.TestCase):
         self.assertIsNotNone(monitor.last_lidar_data)
         self.assertIsNotNone(monitor.last_lidar_timestamp)
     
+    def test_parse_lidar_timestamp(self):
+        """Test LiDAR timestamps parse to naive local datetimes."""
+        now = datetime.now().replace(microsecond=0)
+        
+        self.assertEqual(_parse_lidar_timestamp({"timestamp": now.isoformat()}), now)
+        
+        utc_string = now.astimezone().astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.assertEqual(_parse_lidar_timestamp({"timestamp": utc_string}), now)
+        
+        from_ns = _parse_lidar_timestamp({"timestamp": "ignored", "timestamp_ns": int(now.timestamp() * 1e9)})
+        self.assertEqual(from_ns, now)
+    
+    def test_subscribes_to_estop_ack_only(self):
+        """Test the monitor listens for e-stop acks rather than all status topics."""
+        monitor = SafetyMonitor()
+        monitor.start()
+        monitor.stop()
+        
+        topics = [call[0][0] for call in self.mock_mqtt_client.subscribe.call_args_list]
+        self.assertIn("orchestrator/ack/estop", topics)
+        self.assertNotIn("orchestrator/status/+", topics)
+    
     def test_handle_invalid_lidar_data(self):
         """Test handling invalid LiDAR data messages."""
         monitor = SafetyMonitor()
@@ -259,17 +380,8 @@ class TestSafetyMonitor(unittest.TestCase):
         """Test that emergency stop commands have correct format."""
         monitor = SafetyMonitor()
         
-        # Create obstacle detection
-        obstacle = ObstacleDetection(
-            timestamp=datetime.now(),
-            distance=0.3,
-            angle=0.0,
-            zone="critical_front",
-            severity="critical"
-        )
-        
-        # Trigger emergency stop
-        monitor._trigger_emergency_stop([obstacle])
+        # Closest of two critical detections (zone 0 is critical_front)
+        self.assertTrue(monitor._trigger_emergency_stop(0.3, 0.0, 0, 2))
         
         # Check published command format
         self.mock_mqtt_client.publish.assert_called()
@@ -293,6 +405,9 @@ class TestSafetyMonitor(unittest.TestCase):
         self.assertEqual(estop_call["source"], "safety_monitor")
         self.assertIn("obstacle_info", estop_call)
         self.assertIn("parameters", estop_call)
+        self.assertEqual(estop_call["obstacle_info"]["distance"], 0.3)
+        self.assertEqual(estop_call["obstacle_info"]["zone"], "critical_front")
+        self.assertEqual(estop_call["obstacle_info"]["total_obstacles"], 2)
     
     def test_data_timeout_detection(self):
         """Test detection of LiDAR data timeouts."""
@@ -316,7 +431,7 @@ class TestSafetyMonitor(unittest.TestCase):
         monitor.emergency_stop_active = True
         
         # Clear recent detections
-        monitor.obstacle_detections = []
+        monitor.obstacle_detections.clear()
         
         # Check for reset
         monitor._check_emergency_stop_reset()
@@ -342,15 +457,74 @@ class TestSafetyMonitor(unittest.TestCase):
         self.assertGreater(monitor.avg_processing_time, 0)
         self.assertGreater(monitor.max_processing_time, 0)
     
+    def test_processing_time_running_average(self):
+        """Test the running average tracks the bounded processing-time window."""
+        monitor = SafetyMonitor()
+        lidar_data = {
+            "timestamp": datetime.now().isoformat(),
+            "ranges": [2.0] * 72,
+            "angles": list(range(0, 360, 5))
+        }
+        
+        for _ in range(monitor.processing_times.maxlen + 10):
+            monitor._process_lidar_data(lidar_data)
+        
+        self.assertEqual(len(monitor.processing_times), monitor.processing_times.maxlen)
+        expected = sum(monitor.processing_times) / len(monitor.processing_times)
+        self.assertAlmostEqual(monitor.avg_processing_time, expected, places=9)
+    
+    def test_thread_scheduling_applied_once_per_thread(self):
+        """Test configured real-time scheduling is applied once per thread."""
+        self.mock_config.safety.realtime_priority = 50
+        self.mock_config.safety.cpu_affinity = [2]
+        monitor = SafetyMonitor()
+        
+        with patch('hal_service.safety_monitor.os') as mock_os:
+            monitor._apply_thread_scheduling()
+            monitor._apply_thread_scheduling()
+        
+        mock_os.sched_setscheduler.assert_called_once_with(
+            0, mock_os.SCHED_FIFO, mock_os.sched_param.return_value
+        )
+        mock_os.sched_param.assert_called_once_with(50)
+        mock_os.sched_setaffinity.assert_called_once_with(0, {2})
+    
+    def test_thread_scheduling_permission_error(self):
+        """Test missing privileges only log a warning."""
+        self.mock_config.safety.realtime_priority = 50
+        monitor = SafetyMonitor()
+        
+        with patch('hal_service.safety_monitor.os') as mock_os:
+            mock_os.sched_setscheduler.side_effect = PermissionError("not permitted")
+            monitor._apply_thread_scheduling()
+        
+        self.mock_logger.warning.assert_called()
+        mock_os.sched_setaffinity.assert_not_called()
+    
+    def test_system_health_cpu_sampling_non_blocking(self):
+        """Test CPU usage is sampled without blocking the watchdog."""
+        with patch('hal_service.safety_monitor.psutil') as mock_psutil:
+            mock_psutil.virtual_memory.return_value.percent = 50.0
+            mock_psutil.cpu_percent.return_value = 10.0
+            monitor = SafetyMonitor()
+            monitor._check_system_health()
+        
+        for call in mock_psutil.cpu_percent.call_args_list:
+            self.assertEqual(call, ((), {'interval': None}))
+        self.assertEqual(mock_psutil.cpu_percent.call_count, 2)
+    
     def test_safety_status_publishing(self):
         """Test publishing of safety status messages."""
         monitor = SafetyMonitor()
         
-        # Publish status
+        # Queue status updates, then flush them as one batch
         monitor._publish_safety_status("active", "Test status message")
+        monitor._publish_safety_status("monitoring", "Safety monitor active")
+        self.mock_mqtt_client.publish.assert_not_called()
+        monitor._flush_safety_status()
         
         # Check that status was published
-        self.mock_mqtt_client.publish.assert_called()
+        self.mock_mqtt_client.publish.assert_called_once()
         
         # Verify status message format
         publish_calls = self.mock_mqtt_client.publish.call_args_list
@@ -367,6 +541,58 @@ class TestSafetyMonitor(unittest.TestCase):
         self.assertIn("status", status_call)
         self.assertIn("statistics", status_call)
         self.assertIn("configuration", status_call)
+        self.assertEqual(status_call["status"], "monitoring")
+        self.assertEqual(status_call["batch_size"], 2)
+        self.assertEqual([e["status"] for e in status_call["events"]], ["active", "monitoring"])
+    
+    def test_emergency_status_published_immediately(self):
+        """Test emergency stop status bypasses batching."""
+        monitor = SafetyMonitor()
+        
+        monitor._publish_safety_status("emergency_stop", "Obstacle")
+        
+        args, kwargs = self.mock_mqtt_client.publish.call_args
+        self.assertEqual(args[0], "orchestrator/status/safety_monitor")
+        self.assertEqual(args[1]["status"], "emergency_stop")
+        self.assertEqual(kwargs["qos"], 1)
+
+
+class TestDetectionHistory(unittest.TestCase):
+    """Test cases for the DetectionHistory ring buffer."""
+    
+    def test_append_wraps_and_keeps_newest(self):
+        """Test the buffer keeps the most recent rows in order."""
+        history = DetectionHistory(capacity=4)
+        
+        history.append_batch(1.0, np.array([1.0, 2.0, 3.0]), np.zeros(3),
+                             np.zeros(3, dtype=np.int16), np.zeros(3, dtype=bool))
+        history.append_batch(2.0, np.array([4.0, 5.0]), np.zeros(2),
+                             np.ones(2, dtype=np.int16), np.array([True, False]))
+        
+        self.assertEqual(len(history), 4)
+        rows = history.recent_rows(10)
+        np.testing.assert_array_equal(history.distances[rows], [2.0, 3.0, 4.0, 5.0])
+        np.testing.assert_array_equal(history.critical[rows], [False, False, True, False])
+        np.testing.assert_array_equal(history.distances[history.recent_rows(2)], [4.0, 5.0])
+        
+        history.clear()
+        self.assertEqual(len(history), 0)
+        self.assertEqual(len(history.recent_rows(10)), 0)
+    
+    def test_has_recent_critical(self):
+        """Test the recent-critical check honours the row window and time cutoff."""
+        history = DetectionHistory(capacity=8)
+        history.append_batch(100.0, np.array([0.3]), np.array([0.0]),
+                             np.array([0]), np.array([True]))
+        history.append_batch(105.0, np.array([0.4, 0.5]), np.array([90.0, 95.0]),
+                             np.array([1, 1]), np.array([False, False]))
+        
+        self.assertTrue(history.has_recent_critical(3, since=99.0))
+        self.assertFalse(history.has_recent_critical(3, since=101.0))
+        self.assertFalse(history.has_recent_critical(2, since=99.0))
+        
+        history.clear()
+        self.assertFalse(history.has_recent_critical(10, since=0.0))
 
 
 class TestSafetyZone(unittest.TestCase):
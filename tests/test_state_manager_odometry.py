@@ -0,0 +1,352 @@
+"""
+Unit tests for StateManager odometry and state publishing.
+
+These tests run without an MQTT broker by patching the MQTT client wrapper
+and logging service.
+"""
+
+import math
+import time
+import unittest
+from dataclasses import FrozenInstanceError, asdict
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from hal_service.state_manager import StateManager, _integrate_motion
+from hal_service.mqtt_client import MQTTConfig
+
+
+class TestStateManagerOdometry(unittest.TestCase):
+    """Test cases for StateManager odometry calculations."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mqtt_patcher = patch('hal_service.state_manager.MQTTClientWrapper')
+        self.logging_patcher = patch('hal_service.state_manager.get_logging_service')
+        
+        self.mock_mqtt_class = self.mqtt_patcher.start()
+        self.mock_logging_service = self.logging_patcher.start()
+        
+        self.mock_mqtt_client = Mock()
+        self.mock_mqtt_client.publish.return_value = True
+        self.mock_mqtt_class.return_value = self.mock_mqtt_client
+        
+        self.mock_logger = Mock()
+        self.mock_logging_service.return_value.get_device_logger.return_value = self.mock_logger
+        
+        self.manager = StateManager(MQTTConfig(), wheel_base=0.3, publish_rate=10.0)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.mqtt_patcher.stop()
+        self.logging_patcher.stop()
+    
+    def _drive(self, left_distance: float, right_distance: float):
+        """Feed cumulative wheel distances and run one odometry update."""
+        self.manager.left_encoder_data = {'total_distance': left_distance}
+        self.manager.right_encoder_data = {'total_distance': right_distance}
+        self.manager.last_update_time = time.time() - 0.1
+        self.manager._record_encoder_sample()
+        self.manager._update_odometry()
+    
+    def test_straight_line_motion(self):
+        """Test driving straight keeps heading and moves along X."""
+        self._drive(1.0, 1.0)
+        
+        state = self.manager.get_current_state()
+        self.assertAlmostEqual(state.position.x, 1.0)
+        self.assertAlmostEqual(state.position.y, 0.0)
+        self.assertAlmostEqual(state.heading, 0.0)
+    
+    def test_turn_then_straight(self):
+        """Test position follows the heading after an in-place turn."""
+        quarter_turn = math.pi / 2 * 0.3 / 2  # wheel arc for a 90° spin
+        self._drive(-quarter_turn, quarter_turn)
+        self._drive(-quarter_turn + 1.0, quarter_turn + 1.0)
+        
+        state = self.manager.get_current_state()
+        self.assertAlmostEqual(state.heading, math.pi / 2)
+        self.assertAlmostEqual(state.position.x, 0.0)
+        self.assertAlmostEqual(state.position.y, 1.0)
+    
+    def test_heading_normalized_after_large_rotation(self):
+        """Test heading wraps into [-pi, pi] even after many revolutions."""
+        arc = 10.5 * math.pi * 0.3 / 2  # 5.25 turns counter-clockwise
+        self._drive(-arc, arc)
+        
+        state = self.manager.get_current_state()
+        self.assertAlmostEqual(state.heading, math.pi / 2)
+    
+    def test_set_position_updates_heading_direction(self):
+        """Test motion after set_position uses the new heading."""
+        self.manager._set_position(1.0, 2.0, math.pi)
+        self._drive(0.5, 0.5)
+        
+        state = self.manager.get_current_state()
+        self.assertAlmostEqual(state.position.x, 0.5)
+        self.assertAlmostEqual(state.position.y, 2.0)
+    
+    def test_state_to_dict_matches_asdict(self):
+        """Test the hand-built publish dict matches the dataclass layout."""
+        self._drive(0.4, 0.6)
+        
+        state_dict = self.manager._state_to_dict()
+        expected = asdict(self.manager.get_current_state())
+        
+        for key, value in expected.items():
+            self.assertEqual(state_dict[key], value)
+        self.assertEqual(state_dict['wheel_base'], 0.3)
+        self.assertEqual(state_dict['update_count'], 1)
+        self.assertIn('timestamp', state_dict)
+    
+    def test_publish_buffer_reused(self):
+        """Test consecutive publishes refill the same message dict."""
+        first = self.manager._state_to_dict()
+        self._drive(1.0, 1.0)
+        second = self.manager._state_to_dict()
+        
+        self.assertIs(first, second)
+        self.assertAlmostEqual(second['position']['x'], 1.0)
+    
+    def test_last_updated_formatted_on_read(self):
+        """Test last_updated reflects the latest update when the state is read."""
+        self.manager._last_updated_ts = 1700000000.0
+        self.manager._set_status("active")
+        
+        state = self.manager.get_current_state()
+        updated = datetime.fromisoformat(state.last_updated)
+        self.assertAlmostEqual(updated.timestamp(), self.manager._last_updated_ts, places=5)
+        self.assertGreater(updated.timestamp(), 1700000000.0)
+    
+    def test_encoder_messages_routed_by_topic(self):
+        """Test each encoder topic is handled once and routed to its side."""
+        self.manager._subscribe_to_encoders()
+        topics = [call[0][0] for call in self.mock_mqtt_client.subscribe.call_args_list]
+        self.assertEqual(sorted(topics), ["orchestrator/data/left_encoder",
+                                          "orchestrator/data/right_encoder"])
+        
+        self.manager.last_update_time = time.time() - 0.1
+        self.manager._handle_encoder_data({
+            'topic': "orchestrator/data/left_encoder",
+            'payload': {'data': {'total_distance': 0.5}}
+        })
+        self.assertEqual(len(self.manager._pending_samples), 0)
+        
+        self.manager._handle_encoder_data({
+            'topic': "orchestrator/data/right_encoder",
+            'payload': {'data': {'total_distance': 0.5}}
+        })
+        self.assertEqual(len(self.manager._pending_samples), 1)
+        
+        self.manager._update_odometry()
+        self.assertEqual(self.manager.update_count, 1)
+        self.assertAlmostEqual(self.manager.get_current_state().position.x, 0.5)
+    
+    def test_updates_swap_state_snapshot(self):
+        """Test updates replace the state snapshot instead of mutating it."""
+        before = self.manager.robot_state
+        before_position = before.position
+        
+        self._drive(1.0, 1.0)
+        self.manager._set_status("active")
+        
+        self.assertIsNot(self.manager.robot_state, before)
+        self.assertEqual((before_position.x, before_position.y), (0.0, 0.0))
+        self.assertEqual(before.status, "idle")
+        self.assertEqual(self.manager.robot_state.status, "active")
+    
+    def test_publish_loop_sleeps_to_absolute_deadlines(self):
+        """Test the publish loop compensates for time spent publishing."""
+        clock = [100.0]
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+            if len(sleeps) == 3:
+                self.manager._running = False
+        
+        def slow_publish():
+            clock[0] += 0.03
+        
+        self.manager._running = True
+        with patch('hal_service.state_manager.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('hal_service.state_manager.time.sleep', side_effect=fake_sleep), \
+             patch.object(self.manager, '_publish_state', side_effect=slow_publish):
+            self.manager._publish_loop()
+        
+        for seconds in sleeps:
+            self.assertAlmostEqual(seconds, 0.07)
+        self.assertAlmostEqual(clock[0], 100.3)
+    
+    def test_publish_loop_skips_unchanged_state_until_heartbeat(self):
+        """Test an idle state is only re-published at the heartbeat interval."""
+        clock = [100.0]
+        published = []
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+            if len(sleeps) == 10:
+                self.manager._set_status("active")
+            if len(sleeps) == 35:
+                self.manager._running = False
+        
+        def fake_publish():
+            published.append(clock[0])
+            self.manager._state_dirty = False
+        
+        self.manager._running = True
+        with patch('hal_service.state_manager.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('hal_service.state_manager.time.sleep', side_effect=fake_sleep), \
+             patch.object(self.manager, '_publish_state', side_effect=fake_publish):
+            self.manager._publish_loop()
+        
+        # Initial publish, one for the status change, then nothing until the
+        # heartbeat comes due two seconds after the last publish
+        self.assertEqual(len(published), 3)
+        self.assertAlmostEqual(published[1] - published[0], 1.0)
+        self.assertGreaterEqual(published[2] - published[1], 2.0 - 1e-9)
+    
+    def test_change_during_publish_stays_dirty(self):
+        """Test a state change made while publishing is published next cycle."""
+        self.mock_mqtt_client.publish.side_effect = (
+            lambda *args, **kwargs: self.manager._set_status("emergency_stop") or True
+        )
+        
+        self.manager._publish_state()
+        
+        self.assertTrue(self.manager._state_dirty)
+        self.assertEqual(self.manager.robot_state.status, "emergency_stop")
+    
+    def test_encoder_samples_folded_at_publish(self):
+        """Test queued samples are integrated in order when the state is published."""
+        quarter_turn = math.pi / 2 * 0.3 / 2
+        self.manager.left_encoder_data = {'total_distance': 0.0}
+        self.manager.right_encoder_data = {'total_distance': 0.0}
+        self.manager.last_update_time = time.time() - 0.2
+        
+        for left, right in [(1.0, 1.0), (1.0 - quarter_turn, 1.0 + quarter_turn),
+                            (2.0 - quarter_turn, 2.0 + quarter_turn)]:
+            self.manager.left_encoder_data = {'total_distance': left}
+            self.manager.right_encoder_data = {'total_distance': right}
+            self.manager._record_encoder_sample()
+        
+        self.assertEqual(self.manager.update_count, 0)
+        self.manager._publish_state()
+        
+        args, kwargs = self.mock_mqtt_client.publish.call_args
+        self.assertEqual(args[0], "orchestrator/status/robot")
+        self.assertEqual(kwargs['qos'], 0)
+        payload = args[1]
+        self.assertEqual(payload['update_count'], 3)
+        self.assertAlmostEqual(payload['position']['x'], 1.0)
+        self.assertAlmostEqual(payload['position']['y'], 1.0)
+        self.assertAlmostEqual(payload['heading'], math.pi / 2)
+        self.assertEqual(len(self.manager._pending_samples), 0)
+        self.assertAlmostEqual(payload['encoder_data']['left_total'], 2.0 - quarter_turn)
+        self.assertAlmostEqual(payload['encoder_data']['right_total'], 2.0 + quarter_turn)
+        self.assertEqual(set(payload['encoder_data']), {'left_total', 'right_total', 'last_update_ts'})
+    
+    def test_position_and_velocity_are_immutable(self):
+        """Test snapshot components cannot be modified in place."""
+        state = self.manager.get_current_state()
+        
+        with self.assertRaises(FrozenInstanceError):
+            state.position.x = 1.0
+        with self.assertRaises(FrozenInstanceError):
+            state.velocity.linear = 1.0
+    
+    def test_current_state_shared_until_changed(self):
+        """Test repeated reads return the same immutable snapshot until an update."""
+        state = self.manager.get_current_state()
+        
+        self.assertIs(self.manager.get_current_state(), state)
+        with self.assertRaises(FrozenInstanceError):
+            state.status = "active"
+        
+        self.manager._set_status("active")
+        updated = self.manager.get_current_state()
+        self.assertIsNot(updated, state)
+        self.assertEqual(updated.status, "active")
+        self.assertEqual(state.status, "idle")
+    
+    def test_sample_queue_drained_in_place(self):
+        """Test samples are drained from the same queue and dropped by a reset."""
+        queue = self.manager._pending_samples
+        self.manager.left_encoder_data = {'total_distance': 1.0}
+        self.manager.right_encoder_data = {'total_distance': 1.0}
+        self.manager._record_encoder_sample()
+        self.manager._update_odometry()
+        
+        self.assertIs(self.manager._pending_samples, queue)
+        self.assertAlmostEqual(self.manager.get_current_state().position.x, 1.0)
+        
+        self.manager.left_encoder_data = {'total_distance': 2.0}
+        self.manager.right_encoder_data = {'total_distance': 2.0}
+        self.manager._record_encoder_sample()
+        self.manager._reset_odometry()
+        self.manager._update_odometry()
+        
+        self.assertIs(self.manager._pending_samples, queue)
+        self.assertAlmostEqual(self.manager.get_current_state().position.x, 0.0)
+    
+    def test_performance_metrics_queued_until_drained(self):
+        """Test odometry metrics are buffered instead of logged on the publish path."""
+        for step in range(1, 101):
+            self._drive(0.01 * step, 0.01 * step)
+        
+        self.mock_logger.log_performance_metric.assert_not_called()
+        self.assertEqual(len(self.manager._metric_ring), 1)
+        
+        self.manager._drain_metrics()
+        
+        self.assertEqual(len(self.manager._metric_ring), 0)
+        name, value, unit = self.mock_logger.log_performance_metric.call_args[0]
+        self.assertEqual((name, unit), ("odometry_update_rate", "Hz"))
+        self.assertGreater(value, 0)
+    
+    def test_metrics_thread_stops_promptly(self):
+        """Test stopping the service doesn't wait out the metrics drain interval."""
+        self.manager.start()
+        start = time.monotonic()
+        self.manager.stop()
+        
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertFalse(self.manager._metrics_thread.is_alive())
+    
+    def test_encoder_message_without_data_is_logged(self):
+        """Test a malformed encoder message is logged and leaves state untouched."""
+        self.manager._handle_encoder_data({
+            'topic': "orchestrator/data/left_encoder",
+            'payload': {'device_id': "left_encoder"}
+        })
+        
+        self.mock_logger.exception.assert_called_once_with("Error handling encoder data")
+        self.assertIsNone(self.manager.left_encoder_data)
+    
+    def test_integrate_motion_matches_sequential_updates(self):
+        """Test the vectorized batch integration matches one-at-a-time updates."""
+        rng = np.random.default_rng(7)
+        delta_distances = rng.uniform(-0.05, 0.2, 50)
+        delta_headings = rng.uniform(-0.4, 0.4, 50)
+        
+        x, y, heading = 0.5, -1.0, 3.0
+        for distance, turn in zip(delta_distances, delta_headings):
+            heading = math.remainder(heading + turn, math.tau)
+            x += distance * math.cos(heading)
+            y += distance * math.sin(heading)
+        
+        result = _integrate_motion(0.5, -1.0, 3.0, delta_distances, delta_headings)
+        self.assertAlmostEqual(result[0], x)
+        self.assertAlmostEqual(result[1], y)
+        self.assertAlmostEqual(result[2], heading)
+        self.assertAlmostEqual(result[3], math.sin(heading))
+        self.assertAlmostEqual(result[4], math.cos(heading))
+
+
+if __name__ == '__main__':
+    unittest.main()